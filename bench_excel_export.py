@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming Excel export vs. the old cell() loop, with and without lxml
+
+    python bench_excel_export.py [rows]
+
+Each variant runs in its own process, because openpyxl picks its XML
+serializer (lxml or the et_xmlfile fallback) at import time from
+OPENPYXL_LXML. Every file is read back to check the last row.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+
+def export(mode, rows, path):
+    import openpyxl
+    import openpyxl.xml
+    from zero_system.modules.excel_io import write_excel_rows
+
+    data = [["ID", "Name", "Value", "Timestamp"]]
+    data += [[i, f"Zero Enhanced Data {i}", i * 1.5, "2026-10-19 07:00:00"] for i in range(rows)]
+    started = time.perf_counter()
+    if mode == "cell-loop":
+        # Jalur lama write_excel_data: workbook biasa, satu ws.cell() per sel
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        for row_index, row in enumerate(data, 1):
+            for col_index, value in enumerate(row, 1):
+                sheet.cell(row=row_index, column=col_index, value=value)
+        workbook.save(path)
+    else:
+        write_excel_rows(path, data)
+    elapsed = time.perf_counter() - started
+
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    last = next(workbook.active.iter_rows(min_row=rows + 1, max_row=rows + 1, values_only=True))
+    workbook.close()
+    ok = last == (rows - 1, f"Zero Enhanced Data {rows - 1}", (rows - 1) * 1.5, "2026-10-19 07:00:00")
+    print(f"{elapsed:.3f} {openpyxl.xml.LXML} {ok}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        export(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+        sys.exit(0)
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"📊 Excel export: {rows:,} rows x 4 columns")
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("cell-loop", "streaming"):
+            for lxml in ("True", "False"):
+                env = {**os.environ, "OPENPYXL_LXML": lxml}
+                path = os.path.join(directory, f"{mode}-{lxml}.xlsx")
+                output = subprocess.run([sys.executable, __file__, "--child", mode, str(rows), path],
+                                        env=env, capture_output=True, text=True, check=True).stdout.split()
+                elapsed, active, ok = float(output[0]), output[1] == "True", output[2] == "True"
+                serializer = "lxml" if active else "et_xmlfile"
+                print(f"   {mode:<10} {serializer:<11}: {elapsed:7.2f}s  {rows / elapsed:9.0f} rows/s "
+                      f"{'✅' if ok else '❌'}")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: text statistics engine vs. the old multi-pass analyzer
+
+    python bench_text_analysis.py [size_kb] [repeats]
+
+The "legacy" function is the pre-engine advanced_text_analysis body
+(without sentiment, which is identical in both paths).
+"""
+
+import re
+import sys
+import time
+import random
+from collections import Counter
+
+from zero_system.modules.analysis_cache import AnalysisCache
+from zero_system.modules.text_analysis import analyze_text, set_analysis_cache
+
+
+def legacy_text_stats(text_content):
+    lines = text_content.split('\n')
+    words = text_content.split()
+    sentences = re.split(r'[.!?]+', text_content)
+    basic_stats = {
+        "total_lines": len(lines),
+        "total_words": len(words),
+        "total_characters": len(text_content),
+        "total_sentences": len([s for s in sentences if s.strip()]),
+        "avg_words_per_line": len(words) / len(lines) if lines else 0,
+        "avg_words_per_sentence": len(words) / len(sentences) if sentences else 0
+    }
+    words_lower = [word.lower().strip('.,!?";') for word in words if len(word) > 3]
+    return basic_stats, dict(Counter(words_lower).most_common(10))
+
+
+def sample_text(size_kb, seed=42):
+    """Roughly English/Indonesian-shaped text: half short function words"""
+    rng = random.Random(seed)
+    short_words = "the of and a to in is it that for on as with was at by be this are yang di ke dan ini itu".split()
+    long_words = ("market data analysis system server request response growth strong weak report network "
+                  "latency throughput sentiment keyword performance database application security").split()
+    words = []
+    size = 0
+    while size < size_kb * 1024:
+        word = rng.choice(short_words) if rng.random() < 0.5 else rng.choice(long_words)
+        if rng.random() < 0.05:
+            word = word.capitalize()
+        if rng.random() < 0.06:
+            word += rng.choice(".!?,")
+        if rng.random() < 0.01:
+            word += "\n"
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def best_of(function, text, repeats):
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function(text)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    size_kb = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    text = sample_text(size_kb)
+
+    legacy = best_of(legacy_text_stats, text, repeats)
+    # Memo cache dimatikan (ram_entries=0, tanpa disk): setiap putaran mengukur engine, bukan cache hit
+    set_analysis_cache(AnalysisCache(ram_entries=0))
+    engine = best_of(analyze_text, text, repeats)
+    set_analysis_cache(AnalysisCache())
+    analyze_text(text)
+    cached = best_of(analyze_text, text, repeats)
+
+    print(f"📏 Text: {len(text):,} characters, {len(text.split()):,} words (best of {repeats})")
+    print(f"   legacy multi-pass : {legacy * 1000:8.1f} ms")
+    print(f"   stats engine      : {engine * 1000:8.1f} ms")
+    print(f"   speed-up          : {legacy / engine:8.2f}x")
+    print(f"   memo cache hit    : {cached * 1000:8.1f} ms")
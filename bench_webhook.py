@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Load test: local webhook receiver -> bounded queue -> batched data sink
+
+    python bench_webhook.py [requests] [clients] [queue_size]
+
+Clients run in separate processes on keep-alive connections and report
+per-request latency; at the end every accepted payload must be in the sink.
+"""
+
+import sys
+import json
+import time
+import socket
+import tempfile
+import http.client
+from multiprocessing import Pool
+
+from zero_system.modules.data_sink import DataSink
+from zero_system.modules.webhook_receiver import WebhookReceiver
+
+
+def client(args):
+    """Send `count` webhooks on one connection; returns (latencies, status counts)"""
+    port, client_id, count = args
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    connection.connect()
+    # Seperti urllib3/requests: tanpa Nagle, header dan body tidak saling menunggu ACK
+    connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    latencies, statuses = [], {}
+    for i in range(count):
+        body = json.dumps({"client": client_id, "seq": i, "event": "order.created",
+                           "data": {"amount": i * 1.5, "currency": "IDR"}})
+        started = time.perf_counter()
+        connection.request("POST", "/hooks/bench", body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - started)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+    connection.close()
+    return latencies, statuses
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else 0.0
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    queue_size = int(sys.argv[3]) if len(sys.argv) > 3 else 10000
+
+    with tempfile.TemporaryDirectory() as root:
+        sink = DataSink(root)
+
+        def store(batch):
+            sink.append("bench", [{"received_at": item["received_at"], **item["payload"]} for item in batch])
+
+        receiver = WebhookReceiver(store, port=0, queue_size=queue_size)
+        port = receiver.start()
+        per_client = total // clients
+
+        with Pool(clients) as pool:
+            started = time.perf_counter()
+            results = pool.map(client, [(port, c, per_client) for c in range(clients)])
+            elapsed = time.perf_counter() - started
+
+        receiver.stop()
+        sink.close()
+        stats = receiver.stats()
+        stored = sum(1 for _ in sink.iter_rows("bench"))
+
+    latencies = [latency for result in results for latency in result[0]]
+    statuses = {}
+    for _, counts in results:
+        for status, count in counts.items():
+            statuses[status] = statuses.get(status, 0) + count
+
+    print(f"📥 Webhooks: {len(latencies):,} requests from {clients} clients (queue {queue_size:,})")
+    print(f"   throughput        : {len(latencies) / elapsed:8.0f} req/s")
+    print(f"   latency p50 / p99 : {percentile(latencies, 0.5) * 1000:.2f} / {percentile(latencies, 0.99) * 1000:.2f} ms")
+    print(f"   responses         : {statuses}")
+    print(f"   batches flushed   : {stats['batches']} (avg {stats['flushed'] / max(stats['batches'], 1):.0f} payloads)")
+    print(f"   stored / accepted : {stored:,} / {stats['accepted']:,} {'✅' if stored == stats['accepted'] else '❌'}")
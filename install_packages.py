@@ -20,7 +20,9 @@ def install_packages():
         'numpy',
         'matplotlib',
         'pillow',
-        'openpyxl'
+        'openpyxl',
+        'lxml',
+        'nltk'
     ]
     
     print("🚀 MAVERNET PACKAGE INSTALLER")
@@ -54,7 +56,9 @@ def install_packages():
         'numpy': 'numpy', 
         'matplotlib': 'matplotlib',
         'pillow': 'PIL',
-        'openpyxl': 'openpyxl'
+        'openpyxl': 'openpyxl',
+        'lxml': 'lxml',
+        'nltk': 'nltk'
     }
     
     for package, import_name in test_imports.items():
@@ -69,6 +73,15 @@ def install_packages():
     for package, status in test_results.items():
         print(f"{package:<20} {status}")
     
+    # NLTK data is fetched once here; the agents themselves never download at boot
+    print("\n📚 Fetching NLTK data into data/nltk_data...")
+    try:
+        from zero_system.modules import nltk_resources
+        for name, ok in nltk_resources.fetch().items():
+            print(f"{name:<20} {'✅ OK' if ok else '❌ FAILED'}")
+    except Exception as e:
+        print(f"❌ NLTK data fetch failed: {e}")
+    
     # Check web connectivity
     print("\n🌐 Testing web connectivity...")
     try:
@@ -20,6 +20,18 @@ class ZeroAutonomousRunner:
         self.zero = None
         self.setup_signal_handlers()
         
+        # Task schedule lives on the runner so last_run survives between cycles
+        self.tasks = [
+            {"name": "self_repair", "interval": 300, "last_run": 0},  # Every 5 minutes
+            {"name": "system_analysis", "interval": 600, "last_run": 0},  # Every 10 minutes
+            {"name": "threat_assessment", "interval": 900, "last_run": 0},  # Every 15 minutes
+            {"name": "create_dashboard", "interval": 1800, "last_run": 0},  # Every 30 minutes
+            {"name": "memory_save", "interval": 180, "last_run": 0},  # Every 3 minutes
+            {"name": "library_check", "interval": 3600, "last_run": 0},  # Every hour
+            {"name": "url_watch", "interval": 30, "last_run": 0},  # Every cycle; watches track their own intervals
+            {"name": "sink_export", "interval": 3600, "last_run": 0},  # Hourly; only datasets with new rows
+        ]
+        
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown"""
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -55,18 +67,9 @@ class ZeroAutonomousRunner:
         
     def autonomous_task_scheduler(self):
         """Autonomous task scheduler"""
-        tasks = [
-            {"name": "self_repair", "interval": 300, "last_run": 0},  # Every 5 minutes
-            {"name": "system_analysis", "interval": 600, "last_run": 0},  # Every 10 minutes
-            {"name": "threat_assessment", "interval": 900, "last_run": 0},  # Every 15 minutes
-            {"name": "create_dashboard", "interval": 1800, "last_run": 0},  # Every 30 minutes
-            {"name": "memory_save", "interval": 180, "last_run": 0},  # Every 3 minutes
-            {"name": "library_check", "interval": 3600, "last_run": 0},  # Every hour
-        ]
-        
         current_time = time.time()
         
-        for task in tasks:
+        for task in self.tasks:
             if current_time - task["last_run"] >= task["interval"]:
                 self.execute_autonomous_task(task["name"])
                 task["last_run"] = current_time
@@ -93,6 +96,17 @@ class ZeroAutonomousRunner:
                 result = self.zero.create_system_dashboard()
                 print(f"🎨 Dashboard: {'Created' if result else 'Failed'}")
                 
+            elif task_name == "url_watch":
+                events = self.zero.run_url_watches()
+                changed = len([e for e in events if e["status"] == "changed"])
+                if events:
+                    print(f"👁️ URL watch: {len(events)} checked, {changed} changed")
+                
+            elif task_name == "sink_export":
+                exported = self.zero.materialize_datasets()
+                if exported:
+                    print(f"📤 Sink export: {len(exported)} workbooks rebuilt")
+                
             elif task_name == "memory_save":
                 self.zero.save_memory()
                 print(f"💾 Memory saved successfully")
@@ -177,6 +191,9 @@ class ZeroAutonomousRunner:
             print(f"🔧 Self Repairs: {status['self_repairs']}")
             print(f"💾 Memory Entries: {status['memory_entries']}")
             print(f"✅ Success Rate: {status['success_rate']:.1f}%")
+            web = status['web_traffic']
+            print(f"🛡️ Web Traffic: {web['stats']['requests']} requests, {web['stats']['rejected']} rejected, "
+                  f"open circuits: {', '.join(web['open_circuits']) or 'none'}")
             print(f"🎯 Status: {status['current_status']}")
             print("-" * 50)
             
@@ -23,6 +23,10 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 try:
     import requests
     from bs4 import BeautifulSoup
+    from zero_system.modules.web_client import WebClient, CircuitOpenError
+    from zero_system.modules.web_search import SearchPipeline, DUCKDUCKGO_HTML_URL
+    from zero_system.modules.downloader import SegmentedDownloader
+    from zero_system.modules.web_timing import rounded_timings, format_timing_summary
     WEB_LIBRARIES_AVAILABLE = True
     print("✅ Web libraries (requests, beautifulsoup4) loaded successfully")
 except ImportError as e:
@@ -83,6 +87,16 @@ class ZeroCore:
             self.conversation = None
             print(f"⚠️ [Zero Core]: Running without Gemini AI")
 
+        # Pooled web client with per-host rate limiter + circuit breaker
+        self.web_client = WebClient(
+            rate_per_host=self.config.get("web_rate_per_host", 2.0),
+            burst_per_host=self.config.get("web_burst_per_host", 5),
+            failure_threshold=self.config.get("web_failure_threshold", 5),
+            recovery_timeout=self.config.get("web_recovery_timeout", 30),
+            mode=self.config.get("web_mode"),
+            cassette_dir=self.config.get("web_cassette_dir")
+        ) if WEB_LIBRARIES_AVAILABLE else None
+
         self.status = "Online & Ready"
         
         if self.admin_mode:
@@ -124,7 +138,14 @@ class ZeroCore:
             "max_memory_entries": 1000,
             "autonomous_mode_enabled": True,
             "self_repair_enabled": True,
-            "log_level": "INFO"
+            "log_level": "INFO",
+            "web_rate_per_host": 2.0,
+            "web_burst_per_host": 5,
+            "web_failure_threshold": 5,
+            "web_recovery_timeout": 30,
+            "search_top_n": 5,
+            "search_budget_seconds": 10,
+            "download_segments": 4
         }
         
         try:
@@ -189,8 +210,30 @@ class ZeroCore:
    • AI Integration: {gemini_status}
    • Internet Check: {self.check_internet_connection()}
 
+🛡️ WEB TRAFFIC CONTROL:
+{self._web_traffic_status()}
+
 🎯 All systems operational!"""
 
+    def _web_traffic_status(self):
+        """Format rate limiter and circuit breaker state for status"""
+        if not self.web_client:
+            return "   • Web client not available"
+
+        state = self.web_client.get_state()
+        stats = state["stats"]
+        lines = [
+            f"   • Transport: {state['mode']}" + (f" {state['cassette']}" if state['cassette'] else ""),
+            f"   • Rate Limit: {state['rate_per_host']}/s per host (burst {state['burst_per_host']})",
+            f"   • Requests: {stats['requests']}, Failures: {stats['failures']}, "
+            f"Rejected (circuit open): {stats['rejected']}, Throttled: {stats['throttled_seconds']}s"
+        ]
+        for host, host_state in state["hosts"].items():
+            circuit = host_state["circuit"].upper()
+            detail = f"retry in {host_state['retry_in']}s" if host_state["circuit"] == "open" else f"{host_state['tokens']} tokens"
+            lines.append(f"   • {host}: {circuit} ({host_state['failures']} failures, {detail})")
+        return "\n".join(lines)
+
     def get_help(self):
         """Get comprehensive help information"""
         omega_commands = """
@@ -213,6 +256,8 @@ class ZeroCore:
    • web youtube.com      - Browse YouTube
    • web github.com       - Access GitHub
    • web search [query]   - Search the internet
+   • web download [url] [path] - Parallel resumable download
+   • web stats            - Per-host timing percentiles (DNS, TLS, TTFB...)
    • web check            - Test internet connection
 
 📁 FILE OPERATIONS:
@@ -272,7 +317,16 @@ class ZeroCore:
         
         # Web operations
         elif "web" in command_lower:
-            if "search" in command_lower:
+            if command_lower.startswith("web download"):
+                # Hanya prefiks: URL / query yang memuat kata "download" tetap ke search / request
+                args = command[len("web download"):].split()
+                if len(args) >= 2:
+                    expected_sha256 = args[2] if len(args) >= 3 else None
+                    return self.web_download(args[0], args[1], expected_sha256)
+                return "Format: web download <url> <path> [sha256]"
+            elif command_lower.startswith("web stats"):
+                return self.web_stats()
+            elif "search" in command_lower:
                 query = command.split("search", 1)[-1].strip()
                 if query:
                     return self.web_search(query)
@@ -400,9 +454,9 @@ class ZeroCore:
             
             # Perform request
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, timeout=20, allow_redirects=True)
+                response = self.web_client.get(url, headers=headers, timeout=20, allow_redirects=True)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=payload, timeout=20, allow_redirects=True)
+                response = self.web_client.post(url, headers=headers, json=payload, timeout=20, allow_redirects=True)
             else:
                 return f"❌ Method {method} tidak didukung"
             
@@ -431,6 +485,7 @@ class ZeroCore:
                     result_details.append("JSON parsing error")
                     
             elif 'html' in content_type:
+                parse_started = time.perf_counter()
                 try:
                     soup = BeautifulSoup(response.text, 'html.parser')
                     title = soup.find('title')
@@ -453,15 +508,20 @@ class ZeroCore:
                     
                 except Exception as e:
                     result_details.append(f"HTML parsing error: {e}")
+                self.web_client.add_timing(response, "parse", time.perf_counter() - parse_started)
             else:
                 result_details.append(f"Content: {len(response.text)} characters")
             
+            timings = getattr(response, "zero_timings", {})
+            analysis["timings"] = rounded_timings(timings)
+            
             # Success result
             result_message = f"""🌐 WEB ACCESS SUCCESSFUL!
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 🔗 URL: {analysis['url']}
 📊 Status: {analysis['status_code']} OK
 ⏱️ Response Time: {analysis['response_time']:.2f}s
+⏱️ Phases: {self._format_phases(timings)}
 📄 Content Type: {analysis['content_type']}
 📏 Size: {analysis['content_length']:,} characters
 
@@ -481,6 +541,8 @@ class ZeroCore:
             
             return result_message
         
+        except CircuitOpenError as e:
+            error_msg = f"🛑 Circuit Open: {e.host} sedang gagal, request diblokir (retry dalam {e.retry_in:.0f} detik)"
         except requests.exceptions.Timeout:
             error_msg = f"⏰ Timeout: {url} tidak merespons dalam 20 detik"
         except requests.exceptions.ConnectionError:
@@ -503,10 +565,116 @@ class ZeroCore:
         
         return f"❌ {error_msg}"
 
+    def _format_phases(self, timings):
+        """One-line phase breakdown in milliseconds"""
+        phases = ["resolve", "connect", "tls", "ttfb", "download", "parse"]
+        return ", ".join(f"{phase} {timings[phase] * 1000:.0f}ms" for phase in phases if timings.get(phase) is not None)
+
+    def web_stats(self):
+        """Per-host phase timing percentiles for recent requests"""
+        if not WEB_LIBRARIES_AVAILABLE:
+            return "❌ Web libraries not available. Please install: pip install requests beautifulsoup4"
+        return f"""📈 WEB TIMING STATS (last {len(self.web_client.timing_samples)} requests)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{format_timing_summary(self.web_client.timing_stats())}"""
+
     def web_search(self, query):
-        """Search the web using DuckDuckGo (privacy-friendly)"""
-        search_url = f"https://duckduckgo.com/html/?q={urllib.parse.quote(query)}"
-        return self.web_request(search_url)
+        """Search the web using DuckDuckGo (privacy-friendly) and analyze the top results"""
+        if not WEB_LIBRARIES_AVAILABLE:
+            return "❌ Web libraries not available. Please install: pip install requests beautifulsoup4"
+
+        top_n = self.config.get("search_top_n", 5)
+        budget = self.config.get("search_budget_seconds", 10)
+        print(f"🔎 [Zero Web]: Mencari '{query}' (top {top_n}, budget {budget}s)...")
+
+        try:
+            search_url = os.environ.get("ZERO_SEARCH_URL") or self.config.get("search_url", DUCKDUCKGO_HTML_URL)
+            pipeline = SearchPipeline(self.web_client, search_url=search_url)
+            summary = pipeline.search(query, top_n=top_n, budget=budget)
+        except CircuitOpenError as e:
+            error_msg = f"🛑 Circuit Open: {e.host} sedang gagal, request diblokir (retry dalam {e.retry_in:.0f} detik)"
+        except requests.exceptions.RequestException as e:
+            error_msg = f"📡 Search Error: {str(e)}"
+        except Exception as e:
+            error_msg = f"💥 Unexpected Error: {str(e)}"
+        else:
+            self.add_memory({
+                "type": "web_search",
+                "query": query,
+                "total_results": summary["total_results"],
+                "fetched": summary["fetched"],
+                "elapsed": summary["elapsed"],
+                "results": [{"rank": r["rank"], "title": r["title"], "url": r["url"], "score": r["score"]}
+                            for r in summary["results"]],
+                "success": True
+            })
+
+            if not summary["results"]:
+                return f"🔎 No results found for: {query}"
+
+            lines = []
+            for position, result in enumerate(summary["results"], 1):
+                analysis = result.get("analysis", {})
+                detail = (f"{analysis.get('word_count', 0):,} words, {analysis.get('term_hits', 0)} term hits"
+                          if analysis else result.get("error", "not fetched"))
+                lines.append(f"{position}. {result['title']} (score {result['score']})\n"
+                             f"   🔗 {result['url']}\n"
+                             f"   📝 {result['snippet'][:160]}\n"
+                             f"   📊 {detail}")
+
+            return f"""🔎 WEB SEARCH RESULTS: {query}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📋 Results: {summary['total_results']} found, {summary['fetched']}/{len(summary['results'])} analyzed
+⏱️ Elapsed: {summary['elapsed']:.2f}s (budget {summary['budget']}s)
+
+{chr(10).join(lines)}"""
+
+        self.add_memory({
+            "type": "web_search",
+            "query": query,
+            "error": error_msg,
+            "success": False
+        })
+        return f"❌ {error_msg}"
+
+    def web_download(self, url, file_path, expected_sha256=None):
+        """Download a large file in parallel Range segments with resume"""
+        if not WEB_LIBRARIES_AVAILABLE:
+            return "❌ Web libraries not available. Please install: pip install requests beautifulsoup4"
+        if not self.admin_mode and not self._check_file_permission(file_path):
+            return f"❌ Access denied: {file_path} requires admin privileges"
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+
+        print(f"📥 [Zero Web]: Mengunduh {url} -> {file_path}...")
+        downloader = SegmentedDownloader(self.web_client, segments=self.config.get("download_segments", 4))
+        try:
+            result = downloader.download(url, file_path, expected_sha256=expected_sha256)
+        except Exception as e:
+            self.add_memory({
+                "type": "web_download",
+                "url": url,
+                "file_path": file_path,
+                "error": str(e),
+                "success": False
+            })
+            return f"❌ Download failed (partial progress kept for resume): {e}"
+
+        self.add_memory({
+            "type": "web_download",
+            **result,
+            "success": True
+        })
+
+        throughput = result["throughput_bytes_per_sec"] or 0
+        return f"""📥 DOWNLOAD COMPLETE
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🔗 URL: {url}
+📁 File: {result['path']}
+📏 Size: {result['size']:,} bytes ({result['mode']}, {result['segments']} segments)
+♻️ Resumed: {result['resumed_bytes']:,} bytes
+⏱️ Time: {result['elapsed']:.2f}s ({throughput / 1024 / 1024:.2f} MB/s)
+🔒 SHA-256: {result['sha256']}"""
 
     def check_internet_connection(self):
         """Check if internet connection is available"""
@@ -0,0 +1,4 @@
+"""
+ZERO SYSTEM - Extension modules
+Shared building blocks used by ZeroCore and Zero Enhanced
+"""
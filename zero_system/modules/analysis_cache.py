@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+ZERO ANALYSIS CACHE - Memoized text analysis results
+Keyed by a hash of the text plus the analyzer configuration (analyzer
+version, stopword set, sentiment on/off), so any configuration change
+misses automatically. LRU in RAM with an optional SQLite disk tier; disk
+rows written under another configuration are purged on open. A disk tier
+error (e.g. "database is locked" between corpus workers) drops that process
+to RAM-only instead of failing the analysis.
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from datetime import datetime
+
+RAM_ENTRIES = 2048
+DISK_ENTRIES = 50000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    key TEXT PRIMARY KEY,
+    config TEXT NOT NULL,
+    value TEXT NOT NULL,
+    last_used TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_last_used ON analyses(last_used);
+"""
+
+
+def text_key(text, config):
+    """Cache key of a text under one analyzer configuration"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(config.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """LRU memo of JSON-serializable analysis results (stored serialized, so callers get fresh copies)"""
+
+    def __init__(self, ram_entries=RAM_ENTRIES, disk_path=None, disk_entries=DISK_ENTRIES):
+        self.ram_entries = ram_entries
+        self.disk_path = Path(disk_path) if disk_path else None
+        self.disk_entries = disk_entries
+        self.lock = threading.Lock()
+        self.ram = OrderedDict()
+        self.counters = {"hits": 0, "disk_hits": 0, "misses": 0}
+        self._conn = None
+        self._pid = None
+        self._config = None
+        self.disk_error = None
+
+    def _disk(self, config):
+        """Per-process SQLite connection (never shared across a fork)"""
+        if not self.disk_path or self.disk_error:
+            return None
+        if self._conn is None or self._pid != os.getpid():
+            self.disk_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.disk_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._pid = os.getpid()
+            self._config = None
+        if self._config != config:
+            # Konfigurasi analyzer berubah: hasil lama tidak berlaku lagi
+            self._conn.execute("DELETE FROM analyses WHERE config != ?", (config,))
+            self._conn.commit()
+            self._config = config
+        return self._conn
+
+    def _disk_failed(self, error):
+        """Stop using the disk tier in this process; cached results stay in RAM"""
+        self.disk_error = str(error)
+        try:
+            if self._conn is not None:
+                self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
+        print(f"⚠️ [Analysis Cache]: Disk tier disabled ({error}), using RAM only")
+
+    def get(self, key, config):
+        with self.lock:
+            value = self.ram.get(key)
+            if value is not None:
+                self.ram.move_to_end(key)
+                self.counters["hits"] += 1
+                return json.loads(value)
+            try:
+                conn = self._disk(config)
+                if conn is not None:
+                    row = conn.execute("SELECT value FROM analyses WHERE key = ?", (key,)).fetchone()
+                    if row:
+                        conn.execute("UPDATE analyses SET last_used = ? WHERE key = ?",
+                                     (datetime.now().isoformat(), key))
+                        conn.commit()
+                        self._remember(key, row[0])
+                        self.counters["disk_hits"] += 1
+                        return json.loads(row[0])
+            except sqlite3.Error as e:
+                self._disk_failed(e)
+            self.counters["misses"] += 1
+            return None
+
+    def put(self, key, config, value):
+        serialized = json.dumps(value, ensure_ascii=False)
+        with self.lock:
+            self._remember(key, serialized)
+            try:
+                conn = self._disk(config)
+                if conn is not None:
+                    conn.execute("INSERT OR REPLACE INTO analyses (key, config, value, last_used) "
+                                 "VALUES (?, ?, ?, ?)", (key, config, serialized, datetime.now().isoformat()))
+                    if self.counters["misses"] % 500 == 0:
+                        conn.execute("DELETE FROM analyses WHERE key IN (SELECT key FROM analyses "
+                                     "ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.disk_entries,))
+                    conn.commit()
+            except sqlite3.Error as e:
+                self._disk_failed(e)
+
+    def _remember(self, key, value):
+        self.ram[key] = value
+        self.ram.move_to_end(key)
+        while len(self.ram) > self.ram_entries:
+            self.ram.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.ram.clear()
+            try:
+                conn = self._disk(self._config or "")
+                if conn is not None:
+                    conn.execute("DELETE FROM analyses")
+                    conn.commit()
+            except sqlite3.Error as e:
+                self._disk_failed(e)
+
+    def stats(self):
+        with self.lock:
+            lookups = sum(self.counters.values())
+            hits = self.counters["hits"] + self.counters["disk_hits"]
+            return {**self.counters, "ram_entries": len(self.ram),
+                    "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                    "disk_error": self.disk_error}
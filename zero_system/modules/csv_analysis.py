@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+ZERO CSV ANALYSIS - Streaming CSV / log summaries with chunked pandas
+The file is read with read_csv(chunksize=...); per-column stats, top values
+and group-by aggregates are merged chunk by chunk, so memory is bounded by
+the chunk size and the number of groups, never by the file size.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from zero_system.modules.trending import SpaceSaving
+
+CHUNK_ROWS = 200_000
+TOP_VALUES = 10
+TOP_CAPACITY = 1000
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+CATEGORY_MAX_RATIO = 0.5  # kolom teks dengan nilai unik <= 50% baris chunk dijadikan category
+
+
+def parse_aggregates(spec):
+    """'sum:bytes,mean:latency,count' -> [("sum", "bytes"), ("mean", "latency"), ("count", None)]"""
+    aggregates = []
+    for item in (spec or "count").split(","):
+        func, _, column = item.strip().partition(":")
+        func = func.strip().lower()
+        if func not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate '{func}' (use {', '.join(AGGREGATES)})")
+        aggregates.append((func, column.strip() or None))
+    return aggregates
+
+
+def downcast_chunk(chunk):
+    """Smallest integer dtypes, low-cardinality text as category"""
+    for column in chunk.columns:
+        series = chunk[column]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            chunk[column] = pd.to_numeric(series, downcast="integer")
+        elif (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)) \
+                and series.nunique(dropna=True) <= CATEGORY_MAX_RATIO * len(series):
+            chunk[column] = series.astype("category")
+    return chunk
+
+
+class ColumnSummary:
+    """Mergeable stats of one column: moments for numeric data, heavy hitters for text"""
+
+    def __init__(self, numeric):
+        self.numeric = numeric
+        self.count = 0
+        self.missing = 0
+        self.invalid = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.top = SpaceSaving(TOP_CAPACITY)
+
+    def update(self, series):
+        if self.numeric:
+            values = pd.to_numeric(series, errors="coerce")
+            # Nilai non-angka di kolom numerik dihitung terpisah dari sel kosong
+            self.invalid += int((values.isna() & series.notna()).sum())
+            self.missing += int(series.isna().sum())
+            values = values.dropna().to_numpy(dtype=np.float64)
+            if not len(values):
+                return
+            n = len(values)
+            mean = float(values.mean())
+            m2 = float(((values - mean) ** 2).sum())
+            # Penggabungan varians paralel (Chan et al.)
+            total = self.count + n
+            delta = mean - self.mean
+            self.mean += delta * n / total
+            self.m2 += m2 + delta * delta * self.count * n / total
+            self.count = total
+            low, high = float(values.min()), float(values.max())
+            self.minimum = low if self.minimum is None else min(self.minimum, low)
+            self.maximum = high if self.maximum is None else max(self.maximum, high)
+        else:
+            self.missing += int(series.isna().sum())
+            counts = series.value_counts(dropna=True)
+            self.count += int(counts.sum())
+            self.top.update_many({str(value): int(count) for value, count in counts.items()})
+
+    def to_dict(self, top=TOP_VALUES):
+        summary = {"type": "numeric" if self.numeric else "text", "count": self.count, "missing": self.missing}
+        if self.numeric:
+            summary.update({
+                "invalid": self.invalid,
+                "mean": self.mean if self.count else None,
+                "std": math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else None,
+                "min": self.minimum,
+                "max": self.maximum
+            })
+        else:
+            summary["top_values"] = self.top.top(top)
+        return summary
+
+
+class GroupAggregate:
+    """Running group-by sums / counts / mins / maxes, merged per chunk"""
+
+    def __init__(self, key, aggregates):
+        self.key = key
+        self.aggregates = aggregates
+        self.size = None
+        self.counts = self.sums = self.mins = self.maxs = None
+
+    def value_columns(self, chunk, numeric_columns):
+        columns = []
+        for func, column in self.aggregates:
+            if func == "count" and column is None:
+                continue
+            targets = [column] if column else [c for c in numeric_columns if c != self.key]
+            for target in targets:
+                if target not in chunk.columns:
+                    raise KeyError(f"Unknown column: {target}")
+                if target not in columns:
+                    columns.append(target)
+        return columns
+
+    @staticmethod
+    def _add(running, update):
+        return update if running is None else running.add(update, fill_value=0)
+
+    @staticmethod
+    def _extreme(running, update, how):
+        if running is None:
+            return update
+        return getattr(pd.concat([running, update]).groupby(level=0), how)()
+
+    def update(self, chunk, numeric_columns):
+        if self.key not in chunk.columns:
+            raise KeyError(f"Unknown group-by column: {self.key}")
+        keys = chunk[self.key].astype(str).where(chunk[self.key].notna(), "(missing)")
+        self.size = self._add(self.size, keys.value_counts())
+        columns = self.value_columns(chunk, numeric_columns)
+        if not columns:
+            return
+        values = chunk[columns].apply(pd.to_numeric, errors="coerce")
+        grouped = values.groupby(keys.to_numpy(), sort=False)
+        self.counts = self._add(self.counts, grouped.count())
+        self.sums = self._add(self.sums, grouped.sum())
+        self.mins = self._extreme(self.mins, grouped.min(), "min")
+        self.maxs = self._extreme(self.maxs, grouped.max(), "max")
+
+    def _value(self, func, column, group):
+        if func == "count":
+            return int(self.size.get(group, 0)) if column is None else int(self.counts.at[group, column])
+        if func == "sum":
+            return float(self.sums.at[group, column])
+        if func == "mean":
+            count = self.counts.at[group, column]
+            return float(self.sums.at[group, column] / count) if count else None
+        frame = self.mins if func == "min" else self.maxs
+        value = frame.at[group, column]
+        return None if pd.isna(value) else float(value)
+
+    def to_dict(self, numeric_columns, top=None):
+        """{group: {"count": n, "sum:bytes": x, ...}}, largest groups first"""
+        if self.size is None:
+            return {}
+        groups = self.size.sort_values(ascending=False)
+        if top:
+            groups = groups.head(top)
+        results = {}
+        for group in groups.index:
+            row = {}
+            for func, column in self.aggregates:
+                if func == "count" and column is None:
+                    row["count"] = self._value(func, None, group)
+                    continue
+                for target in [column] if column else [c for c in numeric_columns if c != self.key]:
+                    row[f"{func}:{target}"] = self._value(func, target, group)
+            results[group] = row
+        return results
+
+
+def analyze_csv(path, groupby=None, agg=None, chunk_rows=CHUNK_ROWS, sep=",", top=TOP_VALUES, max_groups=50):
+    """Summarize a CSV / delimited log file in bounded memory
+
+    Returns {"rows", "chunks", "columns": {name: summary}, "groupby", "groups"}.
+    """
+    aggregates = parse_aggregates(agg)
+    group = GroupAggregate(groupby, aggregates) if groupby else None
+    summaries = {}
+    rows = chunks = 0
+    numeric_columns = []
+    peak_chunk_bytes = 0
+
+    # Kolom group-by dibaca sebagai teks: chunk dengan sel kosong akan mem-parse int sebagai float
+    # ("1" vs "1.0"), sehingga satu grup terbelah antar chunk
+    reader = pd.read_csv(path, chunksize=chunk_rows, sep=sep, low_memory=True, on_bad_lines="skip",
+                         engine="c" if len(sep) == 1 else "python", dtype={groupby: str} if groupby else None)
+    for chunk in reader:
+        chunk = downcast_chunk(chunk)
+        peak_chunk_bytes = max(peak_chunk_bytes, int(chunk.memory_usage(deep=True).sum()))
+        if not summaries:
+            # Tipe kolom ditentukan oleh chunk pertama; sel non-angka berikutnya dicatat sebagai invalid
+            for column in chunk.columns:
+                numeric = pd.api.types.is_numeric_dtype(chunk[column].dtype) \
+                    and not pd.api.types.is_bool_dtype(chunk[column].dtype)
+                summaries[column] = ColumnSummary(numeric)
+                if numeric:
+                    numeric_columns.append(column)
+        for column, summary in summaries.items():
+            if column in chunk.columns:
+                summary.update(chunk[column])
+        if group is not None:
+            group.update(chunk, numeric_columns)
+        rows += len(chunk)
+        chunks += 1
+
+    return {
+        "path": str(path),
+        "rows": rows,
+        "chunks": chunks,
+        "peak_chunk_bytes": peak_chunk_bytes,
+        "columns": {column: summary.to_dict(top) for column, summary in summaries.items()},
+        "groupby": groupby,
+        "aggregates": [f"{func}:{column}" if column else func for func, column in aggregates],
+        "groups": group.to_dict(numeric_columns, max_groups) if group is not None else {}
+    }
+
+
+def chart_data(result, limit=20):
+    """{label: value} for generate_chart: first aggregate per group, else top values of the first text column"""
+    if result["groups"]:
+        data = {}
+        for group, values in list(result["groups"].items())[:limit]:
+            value = next(iter(values.values()), None)
+            data[str(group)] = value if value is not None else 0
+        return data
+    for summary in result["columns"].values():
+        if summary["type"] == "text" and summary["top_values"]:
+            return {str(value): count for value, count in summary["top_values"][:limit]}
+    return {column: summary["mean"] for column, summary in result["columns"].items()
+            if summary["type"] == "numeric" and summary["mean"] is not None}
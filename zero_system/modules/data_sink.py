@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+ZERO DATA SINK - Append-only tabular sink with on-demand .xlsx export
+Records are appended to rolling JSONL (or CSV) segments per dataset, with
+fsync batched by row count / time (a background timer syncs idle datasets
+within FSYNC_SECONDS), so an append costs O(batch). A schema
+registry keeps each dataset's columns consistent; a workbook is only built
+(with the streaming writer) when requested or when the schedule finds new rows.
+"""
+
+import os
+import re
+import csv
+import json
+import time
+import itertools
+import threading
+from pathlib import Path
+from datetime import datetime
+
+from zero_system.modules.excel_io import write_excel_sheets
+
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+FSYNC_ROWS = 1000
+FSYNC_SECONDS = 1.0
+EXCEL_MAX_ROWS = 1_048_576  # batas baris per sheet Excel, termasuk header
+FORMATS = ("jsonl", "csv")
+_DATASET_NAME = re.compile(r'^[\w-]{1,31}$')
+
+
+def valid_dataset_name(name):
+    """Dataset names double as directory and sheet names: [A-Za-z0-9_-], at most 31 chars"""
+    return bool(name) and bool(_DATASET_NAME.match(name))
+
+
+class SchemaRegistry:
+    """Columns per dataset (append-only: new fields extend the schema, never reorder it)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.schemas = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.schemas = json.load(f)
+            except Exception:
+                self.schemas = {}
+
+    def columns(self, name):
+        return list(self.schemas.get(name, {}).get("columns", []))
+
+    def extend(self, name, fields):
+        """Add unseen fields to a dataset's schema; returns True when the schema changed"""
+        schema = self.schemas.setdefault(name, {"columns": [], "version": 0})
+        known = set(schema["columns"])
+        added = [field for field in dict.fromkeys(fields) if field not in known]
+        if not added and schema["version"]:
+            return False
+        schema["columns"].extend(added)
+        schema["version"] += 1
+        schema["updated_at"] = datetime.now().isoformat()
+        self._save()
+        return True
+
+    def _save(self):
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.schemas, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class _SegmentWriter:
+    """Open append handle on a dataset's newest segment"""
+
+    def __init__(self, directory, fmt, columns):
+        self.directory = directory
+        self.fmt = fmt
+        self.columns = columns
+        self.file = None
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self._open(reuse=True)
+
+    def _open(self, reuse=False):
+        segments = sorted(self.directory.glob(f"segment-*.{self.fmt}"))
+        index = int(segments[-1].stem.split("-")[1]) if segments else 0
+        if reuse and segments and self._reusable(segments[-1]):
+            self.path = segments[-1]
+        else:
+            self.path = self.directory / f"segment-{index + 1:05d}.{self.fmt}"
+        self.file = open(self.path, 'a', encoding='utf-8', newline='')
+        self.size = self.file.tell()
+        if self.fmt == "csv":
+            self.writer = csv.writer(self.file)
+            if not self.size:
+                self.writer.writerow(self.columns)
+
+    def _reusable(self, path):
+        size = path.stat().st_size
+        if not size:
+            return True
+        if size >= SEGMENT_MAX_BYTES:
+            return False
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                return False  # baris terakhir terpotong (crash): mulai segmen baru
+            if self.fmt == "csv":
+                f.seek(0)
+                return next(csv.reader([f.readline().decode("utf-8")]), []) == self.columns
+        return True
+
+    def roll(self, columns=None):
+        self.sync()
+        self.file.close()
+        if columns is not None:
+            self.columns = columns
+        self._open()
+
+    def write(self, records):
+        if self.fmt == "csv":
+            self.writer.writerows([[record.get(c) for c in self.columns] for record in records])
+        else:
+            self.file.write("".join(json.dumps(record, ensure_ascii=False, default=str) + "\n"
+                                    for record in records))
+        self.file.flush()
+        self.size = self.file.tell()
+        self.unsynced += len(records)
+
+    def sync(self, force=False):
+        if self.unsynced and (force or self.unsynced >= FSYNC_ROWS
+                              or time.monotonic() - self.last_sync >= FSYNC_SECONDS):
+            os.fsync(self.file.fileno())
+            self.unsynced = 0
+            self.last_sync = time.monotonic()
+
+    def close(self):
+        self.sync(force=True)
+        self.file.close()
+
+
+class DataSink:
+    """Per-dataset rolling segments under root/<dataset>/, schemas in root/schemas.json"""
+
+    def __init__(self, root="data/sink", fmt="jsonl", strict=False):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown sink format: {fmt}")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.fmt = fmt
+        self.strict = strict
+        self.lock = threading.Lock()
+        self.registry = SchemaRegistry(self.root / "schemas.json")
+        self.writers = {}
+        self.appended = {}
+        self._closed = threading.Event()
+        self._syncer = None
+
+    def _start_syncer(self):
+        # Tanpa timer, baris batch terakhir baru di-fsync saat ada append berikutnya
+        if self._syncer is None:
+            self._closed.clear()
+            self._syncer = threading.Thread(target=self._sync_loop, name="data-sink-fsync", daemon=True)
+            self._syncer.start()
+
+    def _sync_loop(self):
+        while not self._closed.wait(FSYNC_SECONDS):
+            with self.lock:
+                for writer in self.writers.values():
+                    writer.sync()
+
+    def _writer(self, name):
+        writer = self.writers.get(name)
+        if writer is None:
+            directory = self.root / name
+            directory.mkdir(parents=True, exist_ok=True)
+            writer = self.writers[name] = _SegmentWriter(directory, self.fmt, self.registry.columns(name))
+        return writer
+
+    def append(self, name, records):
+        """Append dict records (or lists in schema order); returns the number of rows written"""
+        if not valid_dataset_name(name):
+            raise ValueError(f"Invalid dataset name: {name!r}")
+        with self.lock:
+            columns = self.registry.columns(name)
+            rows = []
+            for record in records:
+                if not isinstance(record, dict):
+                    if len(record) > len(columns):
+                        raise ValueError(f"Row has {len(record)} values, schema of {name} has {len(columns)} columns")
+                    record = dict(zip(columns, record))
+                rows.append(record)
+            if not rows:
+                return 0
+
+            new_fields = {}
+            known = set(columns)
+            for record in rows:
+                for field in record:
+                    if field not in known:
+                        new_fields[field] = None
+            if new_fields or not columns:
+                if self.strict and columns:
+                    raise ValueError(f"Unknown columns for {name}: {', '.join(new_fields)}")
+                self.registry.extend(name, list(new_fields))
+                columns = self.registry.columns(name)
+                writer = self.writers.get(name)
+                # Header CSV tidak bisa diubah: skema baru memulai segmen baru
+                if writer is not None and self.fmt == "csv":
+                    writer.roll(columns)
+                elif writer is not None:
+                    writer.columns = columns
+
+            writer = self._writer(name)
+            self._start_syncer()
+            writer.write(rows)
+            if writer.size >= SEGMENT_MAX_BYTES:
+                writer.roll()
+            else:
+                writer.sync()
+            self.appended[name] = self.appended.get(name, 0) + len(rows)
+            return len(rows)
+
+    def flush(self, name=None):
+        """fsync pending rows now (one dataset or all)"""
+        with self.lock:
+            for dataset, writer in self.writers.items():
+                if name is None or dataset == name:
+                    writer.sync(force=True)
+
+    def close(self):
+        self._closed.set()
+        if self._syncer is not None:
+            self._syncer.join()
+            self._syncer = None
+        with self.lock:
+            for writer in self.writers.values():
+                writer.close()
+            self.writers.clear()
+
+    def datasets(self):
+        return sorted(self.registry.schemas)
+
+    def segments(self, name):
+        directory = self.root / name
+        return sorted(p for fmt in FORMATS for p in directory.glob(f"segment-*.{fmt}"))
+
+    def iter_rows(self, name):
+        """All rows of a dataset in append order, as lists in the current schema order"""
+        columns = self.registry.columns(name)
+        with self.lock:
+            writer = self.writers.get(name)
+            if writer is not None:
+                writer.file.flush()
+        for segment in self.segments(name):
+            with open(segment, 'r', encoding='utf-8', newline='') as f:
+                if segment.suffix == ".csv":
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    positions = [header.index(c) if c in header else None for c in columns]
+                    for row in reader:
+                        yield [row[i] if i is not None and i < len(row) and row[i] != "" else None
+                               for i in positions]
+                else:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue  # baris terpotong saat crash
+                        yield [record.get(c) for c in columns]
+
+    def needs_materialize(self, name, path=None):
+        """True when segments changed after the last export"""
+        path = Path(path) if path else self.root / f"{name}.xlsx"
+        segments = self.segments(name)
+        if not segments:
+            return False
+        return not path.exists() or max(p.stat().st_mtime for p in segments) > path.stat().st_mtime
+
+    def _sheets(self, name, columns):
+        """(sheet_name, rows) pairs; datasets beyond Excel's row limit spill into name_2, name_3, ..."""
+        rows = self.iter_rows(name)
+        for part in itertools.count(1):
+            first = next(rows, None)
+            if first is None and part > 1:
+                return
+
+            def sheet_rows(first=first):
+                yield columns
+                if first is not None:
+                    yield first
+                    yield from itertools.islice(rows, EXCEL_MAX_ROWS - 2)
+
+            yield (name if part == 1 else f"{name[:27]}_{part}"), sheet_rows()
+            if first is None:
+                return
+
+    def materialize(self, name, path=None):
+        """Build <root>/<name>.xlsx (or `path`) from the segments; returns (path, rows)"""
+        if name not in self.registry.schemas:
+            raise KeyError(f"Unknown dataset: {name}")
+        path = Path(path) if path else self.root / f"{name}.xlsx"
+        started = time.time()
+        written = write_excel_sheets(path, self._sheets(name, self.registry.columns(name)))
+        # mtime = awal ekspor, agar baris yang masuk selama ekspor tetap memicu ekspor berikutnya
+        os.utime(path, (started, started))
+        # Header setiap sheet tidak dihitung sebagai baris data
+        return path, sum(written.values()) - len(written)
+
+    def stats(self):
+        result = {}
+        for name in self.datasets():
+            segments = self.segments(name)
+            result[name] = {"columns": len(self.registry.columns(name)),
+                            "schema_version": self.registry.schemas[name]["version"],
+                            "segments": len(segments),
+                            "bytes": sum(p.stat().st_size for p in segments),
+                            "appended_this_session": self.appended.get(name, 0)}
+        return result
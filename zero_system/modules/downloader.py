@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+ZERO DOWNLOADER - Parallel segmented downloads with resume
+HTTP Range requests over the pooled web client, streamed straight to disk.
+Progress lives next to the target as <path>.part + <path>.part.json.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 256 * 1024
+STATE_SAVE_INTERVAL = 1.0  # seconds between progress checkpoints
+# Byte mentah saja: body yang di-gzip tidak cocok dengan Content-Length HEAD maupun offset Range
+IDENTITY = {"Accept-Encoding": "identity"}
+CONTENT_RANGE_PATTERN = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)", re.IGNORECASE)
+
+
+class DownloadError(Exception):
+    """Size / hash verification or protocol failure"""
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SegmentedDownloader:
+    """Download large files in parallel Range segments, resuming partial files"""
+
+    def __init__(self, web_client, segments=4, chunk_size=CHUNK_SIZE, timeout=30):
+        self.web_client = web_client
+        self.segments = max(1, segments)
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.lock = threading.Lock()
+
+    def probe(self, url):
+        """HEAD the URL: (size or None, supports_ranges, validator)"""
+        response = self.web_client.request("HEAD", url, headers=IDENTITY, timeout=self.timeout,
+                                           allow_redirects=True)
+        response.raise_for_status()
+        size = response.headers.get("Content-Length")
+        ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        return (int(size) if size is not None else None), ranges, validator
+
+    def _plan(self, size):
+        count = min(self.segments, max(1, size // self.chunk_size)) if size else 1
+        step = size // count if size else 0
+        plan = []
+        for i in range(count):
+            start = i * step
+            end = size - 1 if i == count - 1 else start + step - 1
+            plan.append({"start": start, "end": end, "done": 0})
+        return plan
+
+    def _load_state(self, state_path, url, size, validator):
+        if not state_path.exists():
+            return None
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception:
+            return None
+        # Resume hanya jika file di server masih sama
+        if state.get("url") != url or state.get("size") != size or state.get("validator") != validator:
+            return None
+        return state
+
+    def _save_state(self, state_path, state):
+        with self.lock:
+            snapshot = json.dumps(state)
+        tmp_path = state_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot)
+        tmp_path.replace(state_path)
+
+    def _fetch_segment(self, url, part_path, state_path, state, segment):
+        """Stream one byte range into its slot of the .part file"""
+        offset = segment["start"] + segment["done"]
+        if offset > segment["end"]:
+            return 0
+
+        headers = {**IDENTITY, "Range": f"bytes={offset}-{segment['end']}"}
+        response = self.web_client.get(url, headers=headers, stream=True, timeout=self.timeout)
+        try:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise DownloadError(f"Server ignored Range request (HTTP {response.status_code})")
+            content_range = CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+            if not content_range or int(content_range.group(1)) != offset:
+                raise DownloadError(f"Content-Range {response.headers.get('Content-Range')!r} "
+                                    f"does not start at requested offset {offset}")
+            if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+                raise DownloadError(f"Server sent {response.headers['Content-Encoding']}-encoded range")
+
+            received = 0
+            last_save = time.monotonic()
+            with open(part_path, 'r+b') as f:
+                f.seek(offset)
+                for block in response.iter_content(chunk_size=self.chunk_size):
+                    if not block:
+                        continue
+                    remaining = segment["end"] + 1 - (segment["start"] + segment["done"])
+                    block = block[:remaining]
+                    f.write(block)
+                    received += len(block)
+                    with self.lock:
+                        segment["done"] += len(block)
+                    if time.monotonic() - last_save >= STATE_SAVE_INTERVAL:
+                        f.flush()
+                        self._save_state(state_path, state)
+                        last_save = time.monotonic()
+                    if remaining <= len(block):
+                        break
+            return received
+        finally:
+            response.close()
+
+    def _stream_whole(self, url, part_path):
+        """Fallback for servers without Range support / unknown size"""
+        received = 0
+        response = self.web_client.get(url, headers=IDENTITY, stream=True, timeout=self.timeout)
+        try:
+            response.raise_for_status()
+            with open(part_path, 'wb') as f:
+                for block in response.iter_content(chunk_size=self.chunk_size):
+                    if block:
+                        f.write(block)
+                        received += len(block)
+        finally:
+            response.close()
+        return received
+
+    def download(self, url, path, expected_sha256=None, expected_size=None):
+        """Download url to path; returns a summary dict, raises on failure"""
+        started = time.perf_counter()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = Path(f"{path}.part")
+        state_path = Path(f"{path}.part.json")
+
+        size, ranges, validator = self.probe(url)
+        resumed_bytes = 0
+
+        if size and ranges:
+            state = self._load_state(state_path, url, size, validator) if part_path.exists() else None
+            if state:
+                resumed_bytes = sum(s["done"] for s in state["segments"])
+            else:
+                state = {"url": url, "size": size, "validator": validator, "segments": self._plan(size)}
+                with open(part_path, 'wb') as f:
+                    f.truncate(size)
+                self._save_state(state_path, state)
+
+            pending = [s for s in state["segments"] if s["start"] + s["done"] <= s["end"]]
+            try:
+                if pending:
+                    with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                        futures = [executor.submit(self._fetch_segment, url, part_path, state_path, state, s)
+                                   for s in pending]
+                        for future in futures:
+                            future.result()
+            finally:
+                # Simpan progres walaupun gagal, supaya bisa di-resume
+                self._save_state(state_path, state)
+            # .part sudah di-truncate ke ukuran penuh: cek ukuran tidak cukup, setiap segmen harus lengkap.
+            # Segmen yang terputus tanpa exception meninggalkan .part + state untuk di-resume.
+            short = [s for s in state["segments"] if s["done"] != s["end"] - s["start"] + 1]
+            if short:
+                missing = sum(s["end"] - s["start"] + 1 - s["done"] for s in short)
+                raise DownloadError(f"{len(short)} segment(s) ended early ({missing} bytes missing); "
+                                    f"run the download again to resume")
+            mode = "segmented"
+        else:
+            self._stream_whole(url, part_path)
+            mode = "single"
+
+        actual_size = part_path.stat().st_size
+        expected_size = expected_size or size
+        if expected_size is not None and actual_size != expected_size:
+            raise DownloadError(f"Size mismatch: expected {expected_size} bytes, got {actual_size}")
+
+        sha256 = file_sha256(part_path)
+        if expected_sha256 and sha256 != expected_sha256.lower():
+            raise DownloadError(f"SHA-256 mismatch: expected {expected_sha256}, got {sha256}")
+
+        os.replace(part_path, path)
+        if state_path.exists():
+            state_path.unlink()
+
+        elapsed = time.perf_counter() - started
+        transferred = actual_size - resumed_bytes
+        return {
+            "url": url,
+            "path": str(path),
+            "size": actual_size,
+            "sha256": sha256,
+            "mode": mode,
+            "segments": len(state["segments"]) if mode == "segmented" else 1,
+            "resumed_bytes": resumed_bytes,
+            "elapsed": round(elapsed, 3),
+            "throughput_bytes_per_sec": round(transferred / elapsed, 1) if elapsed > 0 else None
+        }
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+ZERO EXCEL IO - Streaming spreadsheet access (openpyxl read-only / write-only)
+Rows are parsed lazily from the sheet XML and yielded one at a time, and
+exports are appended row by row to a write-only workbook, so memory stays
+flat however large the workbook is. openpyxl serializes write-only sheets
+with lxml when it is installed and falls back to et_xmlfile otherwise
+(see bench_excel_export.py).
+"""
+
+import os
+from pathlib import Path
+
+import openpyxl
+from openpyxl.utils import column_index_from_string
+
+
+def _select_sheet(workbook, sheet):
+    """Sheet by name, by 0-based index, or the active sheet when None"""
+    if sheet is None:
+        return workbook.active
+    if isinstance(sheet, int):
+        return workbook.worksheets[sheet]
+    return workbook[sheet]
+
+
+def _column_index(column, header):
+    """0-based index of a column given as int, letter ("C") or header name"""
+    if isinstance(column, int):
+        return column
+    if header is not None and column in header:
+        return header.index(column)
+    if column.isalpha():
+        return column_index_from_string(column.upper()) - 1
+    raise KeyError(f"Unknown column: {column}")
+
+
+def sheet_names(path):
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def iter_excel_rows(path, sheet=None, columns=None, skip_empty=True):
+    """Yield sheet rows as lists; `columns` projects to the given indices / letters / header names"""
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = _select_sheet(workbook, sheet).iter_rows(values_only=True)
+        indices = None
+        if columns is not None:
+            header = None
+            if any(isinstance(c, str) for c in columns):
+                # Nama kolom di-resolve dari baris header (baris pertama yang tidak kosong)
+                for row in rows:
+                    if any(cell is not None for cell in row):
+                        header = list(row)
+                        break
+                else:
+                    return
+            indices = [_column_index(c, header) for c in columns]
+            if header is not None:
+                yield [header[i] if i < len(header) else None for i in indices]
+
+        for row in rows:
+            if skip_empty and all(cell is None for cell in row):
+                continue
+            if indices is None:
+                yield list(row)
+            else:
+                # Baris read-only bisa lebih pendek dari lebar sheet
+                yield [row[i] if i < len(row) else None for i in indices]
+    finally:
+        workbook.close()
+
+
+def _cell(value):
+    """Missing pandas values (NaN / NA / NaT) become empty cells"""
+    if isinstance(value, float) and value != value:
+        return None
+    if type(value).__name__ in ("NAType", "NaTType"):
+        return None
+    return value
+
+
+def _expand_rows(rows):
+    """Rows from plain sequences or pandas DataFrame chunks"""
+    for item in rows:
+        if hasattr(item, "itertuples"):
+            for record in item.itertuples(index=False, name=None):
+                yield [_cell(value) for value in record]
+        else:
+            yield item
+
+
+def write_excel_sheets(path, sheets):
+    """Stream {sheet_name: row iterable} (or (name, rows) pairs) into a write-only workbook
+
+    Row iterables may be lists, generators (e.g. iter_excel_rows) or pandas
+    DataFrame chunks. Returns {sheet_name: rows_written}.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    items = sheets.items() if isinstance(sheets, dict) else sheets
+    workbook = openpyxl.Workbook(write_only=True)
+    written = {}
+    for name, rows in items:
+        worksheet = workbook.create_sheet(title=name)
+        count = 0
+        for row in _expand_rows(rows):
+            worksheet.append(row)
+            count += 1
+        written[name] = count
+    if not written:
+        workbook.create_sheet(title="Sheet")
+    # Tulis ke file sementara dulu agar file lama tidak rusak jika ekspor gagal
+    tmp_path = path.with_name(path.name + ".tmp")
+    workbook.save(tmp_path)
+    os.replace(tmp_path, path)
+    return written
+
+
+def write_excel_rows(path, rows, sheet_name="Sheet"):
+    """Stream one row iterable into a single-sheet workbook; returns rows written"""
+    return write_excel_sheets(path, [(sheet_name, rows)])[sheet_name]
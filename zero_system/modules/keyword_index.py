@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+ZERO KEYWORD INDEX - Incremental document-frequency table for TF-IDF
+Vocabulary terms get integer ids; document frequencies live in a NumPy
+array indexed by id. Adding a document costs O(distinct terms in it):
+the terms are journaled and folded into the .npz snapshot in batches.
+"""
+
+import os
+import json
+import math
+import hashlib
+import threading
+from pathlib import Path
+
+import numpy as np
+
+COMPACT_EVERY = 200  # journaled documents before the snapshot is rewritten
+
+
+def document_key(text):
+    """64-bit key of a text, used to count each distinct document once"""
+    if isinstance(text, str):
+        text = text.encode("utf-8", errors="replace")
+    return int.from_bytes(hashlib.blake2b(text, digest_size=8).digest(), "big")
+
+
+class KeywordIndex:
+    """Document frequencies over everything analyzed so far"""
+
+    def __init__(self, path="data/keyword_index.npz", compact_every=COMPACT_EVERY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.path.with_suffix(".journal.jsonl")
+        self.compact_every = compact_every
+        self.lock = threading.Lock()
+
+        self.terms = []
+        self.term_ids = {}
+        self.df = np.zeros(1024, dtype=np.int64)
+        self.documents = 0
+        self.seen = set()
+        self.journaled = 0
+        self._load()
+
+    def _term_id(self, term):
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.terms.append(term)
+            self.term_ids[term] = term_id
+            if term_id >= len(self.df):
+                self.df = np.concatenate([self.df, np.zeros(len(self.df), dtype=np.int64)])
+        return term_id
+
+    def _load(self):
+        if self.path.exists():
+            with np.load(self.path) as data:
+                count = int(data["term_count"])
+                self.terms = data["terms"].tobytes().decode("utf-8").split("\n") if count else []
+                self.df = np.zeros(max(1024, 2 * count), dtype=np.int64)
+                self.df[:count] = data["df"]
+                self.documents = int(data["documents"])
+                self.seen = set(data["seen"].tolist())
+            self.term_ids = {term: i for i, term in enumerate(self.terms)}
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # baris terakhir terpotong saat crash
+                    self._apply(entry["terms"], entry.get("key"))
+                    self.journaled += 1
+
+    def _apply(self, terms, key):
+        if key is not None:
+            if key in self.seen:
+                return False
+            self.seen.add(key)
+        ids = np.fromiter((self._term_id(t) for t in terms), dtype=np.int64, count=len(terms))
+        self.df[ids] += 1
+        self.documents += 1
+        return True
+
+    def add_document(self, keywords, doc_key=None):
+        """Count one document's distinct terms; documents with a known doc_key are skipped"""
+        terms = list(keywords)
+        with self.lock:
+            if not self._apply(terms, doc_key):
+                return False
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"key": doc_key, "terms": terms}, ensure_ascii=False) + "\n")
+            self.journaled += 1
+            if self.journaled >= self.compact_every:
+                self._save()
+        return True
+
+    def _save(self):
+        count = len(self.terms)
+        blob = "\n".join(self.terms).encode("utf-8")
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, terms=np.frombuffer(blob, dtype=np.uint8), term_count=np.int64(count),
+                     df=self.df[:count], documents=np.int64(self.documents),
+                     seen=np.fromiter(self.seen, dtype=np.uint64, count=len(self.seen)))
+        os.replace(tmp_path, self.path)
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        self.journaled = 0
+
+    def flush(self):
+        with self.lock:
+            self._save()
+
+    def tfidf(self, keywords, top=10):
+        """Rank a document's term counts by tf * smoothed idf against the index"""
+        if not keywords:
+            return {}
+        terms = list(keywords)
+        with self.lock:
+            ids = np.array([self.term_ids.get(t, -1) for t in terms], dtype=np.int64)
+            df = np.where(ids >= 0, self.df[np.maximum(ids, 0)], 0)
+            documents = self.documents
+        tf = np.array([keywords[t] for t in terms], dtype=np.float64)
+        scores = (tf / tf.sum()) * (np.log((1 + documents) / (1 + df)) + 1.0)
+        best = np.argsort(-scores, kind="stable")[:top]
+        return {terms[i]: round(float(scores[i]), 6) for i in best}
+
+    def idf(self, term):
+        with self.lock:
+            term_id = self.term_ids.get(term)
+            df = int(self.df[term_id]) if term_id is not None else 0
+            return math.log((1 + self.documents) / (1 + df)) + 1.0
+
+    def stats(self):
+        with self.lock:
+            return {"documents": self.documents, "vocabulary": len(self.terms),
+                    "pending_documents": self.journaled}
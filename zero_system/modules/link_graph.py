@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+ZERO LINK GRAPH - Crawled link relationships in CSR form
+Adjacency is kept as NumPy CSR arrays (indptr / indices) in an .npz file.
+New pages go to an append-only journal and are folded into the CSR arrays
+in batches, so recording a page never rewrites the whole graph.
+"""
+
+import os
+import json
+import threading
+import urllib.parse
+from pathlib import Path
+
+import numpy as np
+
+COMPACT_EVERY = 5000  # journaled edges before the CSR arrays are rebuilt
+
+
+def normalize_link(base_url, href):
+    """Absolute http(s) URL without fragment, or None for mailto:, javascript:, ..."""
+    url, _ = urllib.parse.urldefrag(urllib.parse.urljoin(base_url, href.strip()))
+    return url if url.startswith(("http://", "https://")) else None
+
+
+def _encode_nodes(nodes):
+    blob = "\n".join(nodes).encode("utf-8")
+    return np.frombuffer(blob, dtype=np.uint8) if blob else np.zeros(0, dtype=np.uint8)
+
+
+def _decode_nodes(blob, count):
+    if not count:
+        return []
+    return blob.tobytes().decode("utf-8").split("\n")
+
+
+class LinkGraph:
+    """Directed page -> link graph, one CSR row per crawled page"""
+
+    def __init__(self, path="data/link_graph.npz", compact_every=COMPACT_EVERY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.path.with_suffix(".journal.jsonl")
+        self.compact_every = compact_every
+        self.lock = threading.Lock()
+
+        self.nodes = []
+        self.node_ids = {}
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.pending = {}
+        self.pending_edges = 0
+        self._load()
+
+    def _node_id(self, url):
+        node_id = self.node_ids.get(url)
+        if node_id is None:
+            node_id = len(self.nodes)
+            self.nodes.append(url)
+            self.node_ids[url] = node_id
+        return node_id
+
+    def _load(self):
+        if self.path.exists():
+            with np.load(self.path) as data:
+                self.indptr = data["indptr"]
+                self.indices = data["indices"]
+                self.nodes = _decode_nodes(data["nodes"], int(data["node_count"]))
+            self.node_ids = {url: i for i, url in enumerate(self.nodes)}
+        if self.journal_path.exists():
+            # Replay halaman yang belum sempat di-compact
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # baris terakhir terpotong saat crash
+                    self._stage(entry["url"], entry["links"])
+
+    def _stage(self, url, links):
+        source = self._node_id(url)
+        targets = np.unique(np.fromiter((self._node_id(link) for link in links), dtype=np.int32, count=len(links)))
+        previous = self.pending.get(source)
+        self.pending_edges += len(targets) - (len(previous) if previous is not None else 0)
+        self.pending[source] = targets
+
+    def set_links(self, url, hrefs, base_url=None):
+        """Record (replace) the outgoing links of a crawled page; returns the link count"""
+        base_url = base_url or url
+        links = sorted({link for link in (normalize_link(base_url, h) for h in hrefs) if link and link != url})
+        with self.lock:
+            self._stage(url, links)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"url": url, "links": links}) + "\n")
+            if self.pending_edges >= self.compact_every:
+                self._compact()
+                self._save()
+        return len(links)
+
+    def _compact(self):
+        """Fold journaled rows into the CSR arrays"""
+        if not self.pending:
+            return
+        n = len(self.nodes)
+        old_rows = len(self.indptr) - 1
+        old_counts = np.diff(self.indptr)
+
+        replaced = np.zeros(n, dtype=bool)
+        sources = np.fromiter(self.pending.keys(), dtype=np.int64, count=len(self.pending))
+        replaced[sources] = True
+
+        edge_rows = np.repeat(np.arange(old_rows, dtype=np.int64), old_counts)
+        keep = ~replaced[edge_rows]
+        new_rows = [np.full(len(t), s, dtype=np.int64) for s, t in self.pending.items()]
+        rows = np.concatenate([edge_rows[keep]] + new_rows)
+        cols = np.concatenate([self.indices[keep]] + list(self.pending.values())).astype(np.int32)
+
+        order = np.argsort(rows, kind="stable")
+        self.indices = cols[order]
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=self.indptr[1:])
+        self.pending = {}
+        self.pending_edges = 0
+
+    def _save(self):
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, indptr=self.indptr, indices=self.indices,
+                     nodes=_encode_nodes(self.nodes), node_count=np.int64(len(self.nodes)))
+        os.replace(tmp_path, self.path)
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+    def flush(self):
+        """Compact the journal and persist the CSR arrays"""
+        with self.lock:
+            self._compact()
+            self._save()
+
+    def csr(self):
+        """(indptr, indices) covering every known node"""
+        with self.lock:
+            self._compact()
+            n = len(self.nodes)
+            indptr = self.indptr
+            if len(indptr) < n + 1:
+                # Node yang hanya muncul sebagai target belum punya baris
+                indptr = np.concatenate([indptr, np.full(n + 1 - len(indptr), indptr[-1], dtype=np.int64)])
+            return indptr, self.indices
+
+    def rank(self, damping=0.85, tol=1e-6, max_iter=100, top=10):
+        """PageRank + in-degree centrality; returns the top pages and run info"""
+        indptr, indices = self.csr()
+        n = len(indptr) - 1
+        if n == 0:
+            return {"nodes": 0, "edges": 0, "iterations": 0, "top": []}
+
+        out_degree = np.diff(indptr).astype(np.float64)
+        in_degree = np.bincount(indices, minlength=n)
+        edge_sources = np.repeat(np.arange(n), np.diff(indptr))
+        dangling = out_degree == 0
+        inv_out = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+
+        scores = np.full(n, 1.0 / n)
+        iterations = 0
+        for iterations in range(1, max_iter + 1):
+            spread = np.bincount(indices, weights=(scores * inv_out)[edge_sources], minlength=n)
+            updated = (1.0 - damping) / n + damping * (spread + scores[dangling].sum() / n)
+            delta = np.abs(updated - scores).sum()
+            scores = updated
+            if delta < tol:
+                break
+
+        centrality = in_degree / (n - 1) if n > 1 else in_degree.astype(np.float64)
+        best = np.argsort(-scores, kind="stable")[:top]
+        return {
+            "nodes": n,
+            "edges": int(len(indices)),
+            "iterations": iterations,
+            "top": [{"url": self.nodes[i], "pagerank": float(scores[i]), "in_degree": int(in_degree[i]),
+                     "in_degree_centrality": float(centrality[i])} for i in best]
+        }
+
+    def stats(self):
+        with self.lock:
+            return {
+                "nodes": len(self.nodes),
+                "edges": int(len(self.indices)),
+                "pending_pages": len(self.pending),
+                "pending_edges": self.pending_edges
+            }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+ZERO NEAR DUPLICATES - SimHash fingerprints + LSH band index
+Pages that differ only by timestamps, ads or counters produce SimHashes a
+few bits apart. The index splits each 64-bit fingerprint into bands; two
+fingerprints within the threshold's Hamming distance always share a band
+(pigeonhole), so lookups only compare against a handful of candidates.
+"""
+
+import re
+import json
+import html
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime
+
+import numpy as np
+
+SIMHASH_BITS = 64
+SHINGLE_WORDS = 3
+DEFAULT_THRESHOLD = 0.95
+
+_SKIP_BLOCKS = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAGS = re.compile(r'<[^>]+>')
+_WORDS = re.compile(r'\w+')
+
+
+def visible_text(markup):
+    """Cheap tag stripping (no DOM) - good enough to fingerprint a page"""
+    return html.unescape(_TAGS.sub(" ", _SKIP_BLOCKS.sub(" ", markup)))
+
+
+def simhash(text, shingle_words=SHINGLE_WORDS):
+    """64-bit SimHash over word shingles, or None for (nearly) empty text"""
+    words = _WORDS.findall(text.lower())
+    if len(words) < shingle_words:
+        return None
+    shingles = {}
+    for i in range(len(words) - shingle_words + 1):
+        shingle = " ".join(words[i:i + shingle_words])
+        shingles[shingle] = shingles.get(shingle, 0) + 1
+
+    digests = b"".join(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest() for s in shingles)
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(len(shingles), SIMHASH_BITS)
+    weights = np.fromiter(shingles.values(), dtype=np.int64, count=len(shingles))
+    # Bit bernilai 1 jika bobot shingle dengan bit 1 lebih besar dari yang 0
+    votes = weights @ (2 * bits.astype(np.int64) - 1)
+    return int("".join("1" if v > 0 else "0" for v in votes), 2)
+
+
+def similarity(a, b):
+    return 1.0 - (a ^ b).bit_count() / SIMHASH_BITS
+
+
+class NearDuplicateIndex:
+    """Persistent SimHash LSH index of analyzed pages"""
+
+    def __init__(self, path="data/simhash_index.jsonl", threshold=DEFAULT_THRESHOLD):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.entries = []
+        self.set_threshold(threshold)
+        self._load()
+
+    def set_threshold(self, threshold):
+        """Similarity in [0, 1]; rebuilds the band tables for the new distance"""
+        self.threshold = threshold
+        self.max_distance = int((1.0 - threshold) * SIMHASH_BITS + 1e-9)
+        # max_distance + 1 band menjamin recall penuh; dibatasi 16 band (4 bit) agar tetap selektif
+        self.band_count = min(self.max_distance + 1, 16)
+        self.band_bits = SIMHASH_BITS // self.band_count
+        self.bands = [{} for _ in range(self.band_count)]
+        for entry_id, entry in enumerate(self.entries):
+            self._index(entry_id, entry["simhash"])
+
+    def _band_keys(self, fingerprint):
+        mask = (1 << self.band_bits) - 1
+        keys = [(fingerprint >> (band * self.band_bits)) & mask for band in range(self.band_count)]
+        # Sisa bit (jika 64 tidak habis dibagi) ikut di band terakhir
+        keys[-1] = fingerprint >> ((self.band_count - 1) * self.band_bits)
+        return keys
+
+    def _index(self, entry_id, fingerprint):
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            self.bands[band].setdefault(key, []).append(entry_id)
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                entry["simhash"] = int(entry["simhash"], 16)
+                self.entries.append(entry)
+                self._index(len(self.entries) - 1, entry["simhash"])
+
+    def find(self, fingerprint):
+        """Most similar indexed page at or above the threshold: (entry, similarity) or None"""
+        if fingerprint is None:
+            return None
+        best = None
+        with self.lock:
+            candidates = set()
+            for band, key in enumerate(self._band_keys(fingerprint)):
+                candidates.update(self.bands[band].get(key, ()))
+            for entry_id in candidates:
+                entry = self.entries[entry_id]
+                score = similarity(fingerprint, entry["simhash"])
+                if score >= self.threshold and (best is None or score > best[1]):
+                    best = (entry, score)
+        return best
+
+    def add(self, fingerprint, url, content_hash, report_id=None):
+        if fingerprint is None:
+            return
+        entry = {"simhash": fingerprint, "url": url, "content_hash": content_hash,
+                 "report_id": report_id, "added_at": datetime.now().isoformat()}
+        with self.lock:
+            self.entries.append(entry)
+            self._index(len(self.entries) - 1, fingerprint)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({**entry, "simhash": f"{fingerprint:016x}"}) + "\n")
+
+    def stats(self):
+        with self.lock:
+            return {"pages": len(self.entries), "threshold": self.threshold,
+                    "max_distance": self.max_distance, "bands": self.band_count}
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+ZERO NLTK RESOURCES - Offline NLTK data manager
+Resources are looked up locally with nltk.data.find (project-local
+data/nltk_data first, then NLTK's usual paths). Nothing is downloaded
+unless fetch() is called explicitly, so importing / booting is network-free.
+"""
+
+import os
+from pathlib import Path
+
+LOCAL_NLTK_DIR = Path(os.environ.get("ZERO_NLTK_DIR", "data/nltk_data"))
+
+# name -> path used by nltk.data.find
+RESOURCES = {
+    "vader_lexicon": "sentiment/vader_lexicon.zip",
+    "stopwords": "corpora/stopwords",
+    "punkt": "tokenizers/punkt"
+}
+
+_registered = False
+
+
+def _nltk():
+    """Import nltk and put the project-local data dir first on its search path"""
+    global _registered
+    import nltk
+    if not _registered:
+        local_dir = str(LOCAL_NLTK_DIR.resolve())
+        if local_dir not in nltk.data.path:
+            nltk.data.path.insert(0, local_dir)
+        _registered = True
+    return nltk
+
+
+def find(name):
+    """Local path of an NLTK resource, or None (never touches the network)"""
+    try:
+        nltk = _nltk()
+        return str(nltk.data.find(RESOURCES.get(name, name)))
+    except (ImportError, LookupError):
+        return None
+
+
+def is_available(name):
+    return find(name) is not None
+
+
+def status():
+    """{resource: local path or None}"""
+    return {name: find(name) for name in RESOURCES}
+
+
+def fetch(names=None, quiet=True):
+    """Download missing resources into the project-local dir; returns {name: ok}"""
+    nltk = _nltk()
+    LOCAL_NLTK_DIR.mkdir(parents=True, exist_ok=True)
+    results = {}
+    for name in names or RESOURCES:
+        if find(name):
+            results[name] = True
+            continue
+        try:
+            nltk.download(name, download_dir=str(LOCAL_NLTK_DIR), quiet=quiet, raise_on_error=True)
+        except Exception:
+            pass
+        results[name] = find(name) is not None
+    return results
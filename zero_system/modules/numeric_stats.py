@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+ZERO NUMERIC STATS - Vectorized statistics for any numeric series
+Describe, quantiles, IQR / z-score outliers, rolling means and trend
+slope over NumPy arrays (ported from Oracle's advanced_statistical_analysis).
+Works on spreadsheet columns, CSV columns and memory-derived time series.
+"""
+
+import numpy as np
+import pandas as pd
+
+IQR_FACTOR = 1.5
+Z_THRESHOLD = 3.0
+MAX_LISTED = 100  # outlier yang ditampilkan; jumlah total selalu dihitung
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+BLOCK = 1 << 16  # blok ~512 KB: temporary per blok tetap di cache, bukan array seukuran input
+
+
+def to_array(values):
+    """float64 array of the finite numeric values (non-numeric items and NaN are dropped)"""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iufb":
+        array = values.astype(np.float64, copy=False)
+    else:
+        array = pd.to_numeric(pd.Series(values, copy=False), errors="coerce").to_numpy(dtype=np.float64)
+    finite = np.isfinite(array)
+    return array if finite.all() else array[finite]
+
+
+def _select(array, positions):
+    """Values at sorted positions of `array` (copy partitioned around the middle position, then each side)"""
+    work = array.copy()
+    pending = [(0, len(work), sorted(set(positions)))]
+    while pending:
+        low, high, wanted = pending.pop()
+        if not wanted:
+            continue
+        # Satu kth per partition memakai jalur SIMD numpy; kth berbentuk list jauh lebih lambat
+        middle = wanted[len(wanted) // 2]
+        work[low:high].partition(middle - low)
+        pending.append((low, middle, [p for p in wanted if p < middle]))
+        pending.append((middle + 1, high, [p for p in wanted if p > middle]))
+    return {p: float(work[p]) for p in positions}
+
+
+def _quantiles(array, qs):
+    """np.quantile(array, qs) (linear interpolation) via _select"""
+    last = len(array) - 1
+    points = [(q, q * last, int(np.floor(q * last))) for q in qs]
+    values = _select(array, [i for _, _, low in points for i in (low, min(low + 1, last))])
+    result = []
+    for q, h, low in points:
+        a, b, t = values[low], values[min(low + 1, last)], h - low
+        # Rumus lerp yang sama dengan numpy
+        result.append(b - (b - a) * (1 - t) if t >= 0.5 else a + t * (b - a))
+    return result
+
+
+def quantiles(values, qs=QUANTILES):
+    """{q: value}; one partition tree for all requested quantiles"""
+    array = to_array(values)
+    if not len(array):
+        return {}
+    return {float(q): v for q, v in zip(qs, _quantiles(array, qs))}
+
+
+def _moments(array, mean):
+    """Σd², Σd³ and Σ(i - ī)·d with d = value - mean, i = 0..n-1, in one pass over cache-sized blocks"""
+    x_mean = (len(array) - 1) / 2
+    m2 = m3 = sxy = 0.0
+    for start in range(0, len(array), BLOCK):
+        deviations = array[start:start + BLOCK] - mean
+        squared = deviations * deviations
+        m2 += float(squared.sum())
+        m3 += float(np.dot(squared, deviations))
+        sxy += float(np.dot(np.arange(start, start + len(deviations), dtype=np.float64) - x_mean, deviations))
+    return m2, m3, sxy
+
+
+def _describe(array, q1, median, q3, mean, m2, m3):
+    count = len(array)
+    variance = m2 / count
+    std = variance ** 0.5
+    minimum, maximum = float(array.min()), float(array.max())
+    return {
+        "count": count,
+        "mean": mean,
+        "median": median,
+        "min": minimum,
+        "max": maximum,
+        "range": maximum - minimum,
+        "std_deviation": std,
+        "variance": variance,
+        "percentile_25": q1,
+        "percentile_75": q3,
+        "iqr": q3 - q1,
+        "skewness": m3 / count / std ** 3 if std else 0.0,
+        "coefficient_of_variation": std / mean if mean else 0.0
+    }
+
+
+def describe(values):
+    """Count, moments, quantiles and spread of a series"""
+    array = to_array(values)
+    if not len(array):
+        return {"count": 0}
+    mean = float(array.mean())
+    m2, m3, _ = _moments(array, mean)
+    return _describe(array, *_quantiles(array, (0.25, 0.5, 0.75)), mean, m2, m3)
+
+
+def _no_outliers():
+    return {"count": 0, "lower_bound": None, "upper_bound": None, "indices": [], "values": []}
+
+
+def _outlier_report(array, mask, lower, upper, max_listed):
+    positions = np.flatnonzero(mask)
+    return {"count": int(len(positions)), "lower_bound": lower, "upper_bound": upper,
+            "indices": positions[:max_listed].tolist(), "values": array[positions[:max_listed]].tolist()}
+
+
+def _iqr_outliers(array, q1, q3, factor, max_listed):
+    iqr = q3 - q1
+    lower, upper = float(q1 - factor * iqr), float(q3 + factor * iqr)
+    return _outlier_report(array, (array < lower) | (array > upper), lower, upper, max_listed)
+
+
+def _zscore_outliers(array, mean, std, threshold, max_listed):
+    if not std:
+        return _no_outliers()
+    lower, upper = mean - threshold * std, mean + threshold * std
+    return _outlier_report(array, (array < lower) | (array > upper), lower, upper, max_listed)
+
+
+def outliers_iqr(values, factor=IQR_FACTOR, max_listed=MAX_LISTED):
+    """Values outside [q1 - factor*iqr, q3 + factor*iqr] (indices are positions among numeric values)"""
+    array = to_array(values)
+    if not len(array):
+        return _no_outliers()
+    q1, q3 = _quantiles(array, (0.25, 0.75))
+    return _iqr_outliers(array, q1, q3, factor, max_listed)
+
+
+def outliers_zscore(values, threshold=Z_THRESHOLD, max_listed=MAX_LISTED):
+    """Values more than `threshold` standard deviations from the mean"""
+    array = to_array(values)
+    if not len(array):
+        return _no_outliers()
+    return _zscore_outliers(array, float(array.mean()), float(array.std()), threshold, max_listed)
+
+
+def rolling_mean(values, window):
+    """Trailing means over `window` points via a cumulative sum (len = n - window + 1)"""
+    array = to_array(values)
+    if window < 1 or len(array) < window:
+        return np.empty(0, dtype=np.float64)
+    sums = np.cumsum(array)
+    sums[window:] = sums[window:] - sums[:-window]
+    return sums[window - 1:] / window
+
+
+def _trend(x_mean, y_mean, sxx, syy, sxy):
+    slope = sxy / sxx if sxx else 0.0
+    r_squared = sxy * sxy / (sxx * syy) if sxx and syy else 0.0
+    # Arah tren hanya dianggap berarti jika kemiringan menjelaskan sebagian variasi
+    direction = "flat" if r_squared < 0.05 or not slope else "increasing" if slope > 0 else "decreasing"
+    return {"slope": slope, "intercept": float(y_mean - slope * x_mean), "r_squared": r_squared,
+            "direction": direction}
+
+
+def trend(values, x=None):
+    """Least-squares slope / intercept / r^2 of the series against x (default: 0..n-1)"""
+    y = to_array(values)
+    n = len(y)
+    if n < 2:
+        return {"slope": 0.0, "intercept": float(y[0]) if n else 0.0, "r_squared": 0.0, "direction": "flat"}
+    y_mean = float(y.mean())
+    if x is None:
+        # x = 0..n-1: rata-rata dan Σ(x - x̄)² punya bentuk tertutup, tidak perlu array arange penuh
+        m2, _, sxy = _moments(y, y_mean)
+        return _trend((n - 1) / 2, y_mean, n * (n * n - 1) / 12, m2, sxy)
+    x = np.asarray(x, dtype=np.float64)
+    x_mean = float(x.mean())
+    dx, dy = x - x_mean, y - y_mean
+    return _trend(x_mean, y_mean, float(np.dot(dx, dx)), float(np.dot(dy, dy)), float(np.dot(dx, dy)))
+
+
+def analyze_series(values, window=None, max_listed=MAX_LISTED):
+    """Full report: describe + quantiles + IQR / z-score outliers + trend (+ rolling mean tail)"""
+    array = to_array(values)
+    if not len(array):
+        return {"basic_stats": {"count": 0}, "quantiles": {}, "outliers_iqr": _no_outliers(),
+                "outliers_zscore": _no_outliers(), "trend": trend(array)}
+    # Semua kuantil dari satu pohon partisi dan semua momen + jumlah tren dari satu pass;
+    # describe, outlier dan tren memakai ulang hasilnya
+    n = len(array)
+    points = dict(zip(QUANTILES, _quantiles(array, QUANTILES)))
+    mean = float(array.mean())
+    m2, m3, sxy = _moments(array, mean)
+    basic = _describe(array, points[0.25], points[0.5], points[0.75], mean, m2, m3)
+    report = {
+        "basic_stats": basic,
+        "quantiles": points,
+        "outliers_iqr": _iqr_outliers(array, points[0.25], points[0.75], IQR_FACTOR, max_listed),
+        "outliers_zscore": _zscore_outliers(array, mean, basic["std_deviation"], Z_THRESHOLD, max_listed),
+        "trend": _trend((n - 1) / 2, mean, n * (n * n - 1) / 12, m2, sxy) if n > 1 else trend(array)
+    }
+    if window:
+        # Hanya ekor yang dilaporkan: cukup hitung rata-rata bergulir max_listed titik terakhir
+        tail = rolling_mean(array[-(max_listed + window - 1):], window)
+        report["rolling_mean"] = {"window": window, "points": max(0, n - window + 1), "last": tail.tolist()}
+    return report
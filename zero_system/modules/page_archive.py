@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+ZERO PAGE ARCHIVE - Compressed raw page archive for offline re-analysis
+WARC-like segments (one gzip member per record) with a SQLite offset index
+by URL and time. Identical bodies are stored once (revisit records).
+"""
+
+import os
+import gzip
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from zero_system.modules.text_analysis import analyze_text, parse_html_page, get_sentiment_analyzer
+
+SEGMENT_MAX_BYTES = 256 * 1024 * 1024
+REANALYZE_BATCH = 200
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    status_code INTEGER,
+    content_type TEXT,
+    content_hash TEXT NOT NULL,
+    segment TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    revisit INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_records_url_time ON records(url, fetched_at);
+CREATE INDEX IF NOT EXISTS idx_records_time ON records(fetched_at);
+CREATE INDEX IF NOT EXISTS idx_records_hash ON records(content_hash);
+"""
+
+
+def _record_bytes(url, fetched_at, status_code, content_type, body):
+    """WARC-style response record: header block + raw body"""
+    header = (
+        "WARC/1.0\r\n"
+        "WARC-Type: response\r\n"
+        f"WARC-Target-URI: {url}\r\n"
+        f"WARC-Date: {fetched_at}\r\n"
+        f"HTTP-Status: {status_code}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "\r\n"
+    ).encode("utf-8")
+    return header + body + b"\r\n\r\n"
+
+
+def read_record(segment_path, offset, length):
+    """Read one gzip member and split it into (headers, body)"""
+    with open(segment_path, 'rb') as f:
+        f.seek(offset)
+        raw = gzip.decompress(f.read(length))
+    head, _, rest = raw.partition(b"\r\n\r\n")
+    headers = {}
+    for line in head.decode("utf-8").split("\r\n")[1:]:
+        name, _, value = line.partition(": ")
+        headers[name] = value
+    body_length = int(headers.get("Content-Length", len(rest)))
+    return headers, rest[:body_length]
+
+
+def _decode_body(body, content_type):
+    charset = "utf-8"
+    match = content_type and "charset=" in content_type and content_type.split("charset=")[-1].split(";")[0].strip()
+    if match:
+        charset = match
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def analyze_archived_page(url, content_type, body):
+    """Default re-analysis: the same HTML + text analyzers as ZeroEnhanced.web_request"""
+    text = _decode_body(body, content_type)
+    # Panjang dalam karakter, sama seperti len(response.text) saat analisis pertama
+    analysis = {"url": url, "content_type": content_type, "content_length": len(text)}
+    if content_type and "html" in content_type:
+        page_summary, text_content, _ = parse_html_page(text)
+        analysis.update(page_summary)
+        analysis["text_analysis"] = analyze_text(text_content, get_sentiment_analyzer())
+    return analysis
+
+
+def _reanalyze_batch(archive_dir, items, analyzer):
+    """Worker: read records straight from the segments and analyze them"""
+    results = []
+    for content_hash, url, content_type, segment, offset, length in items:
+        try:
+            _, body = read_record(Path(archive_dir) / segment, offset, length)
+            results.append((content_hash, url, analyzer(url, content_type, body), None))
+        except Exception as e:
+            results.append((content_hash, url, None, str(e)))
+    return results
+
+
+class PageArchive:
+    """Append-only archive of fetched page bodies"""
+
+    def __init__(self, archive_dir="data/page_archive", segment_max_bytes=SEGMENT_MAX_BYTES):
+        self.archive_dir = Path(archive_dir)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.archive_dir / "index.db"), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(INDEX_SCHEMA)
+        self.conn.commit()
+
+    def _current_segment(self):
+        segments = sorted(self.archive_dir.glob("archive-*.warc.gz"))
+        if segments and segments[-1].stat().st_size < self.segment_max_bytes:
+            return segments[-1]
+        number = int(segments[-1].name.split("-")[1].split(".")[0]) + 1 if segments else 1
+        return self.archive_dir / f"archive-{number:05d}.warc.gz"
+
+    def store(self, url, body, status_code=200, content_type="", fetched_at=None):
+        """Archive one body; returns (record_id, revisit)"""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        fetched_at = fetched_at or datetime.now().isoformat()
+        body_hash = hashlib.sha256(body).hexdigest()
+
+        with self.lock:
+            existing = self.conn.execute(
+                "SELECT segment, offset, length FROM records WHERE content_hash = ? AND revisit = 0 LIMIT 1",
+                (body_hash,)).fetchone()
+            if existing:
+                # Isi identik: cukup tambahkan entri index yang menunjuk ke record lama
+                segment, offset, length, revisit = existing["segment"], existing["offset"], existing["length"], 1
+            else:
+                segment_path = self._current_segment()
+                member = gzip.compress(_record_bytes(url, fetched_at, status_code, content_type, body))
+                with open(segment_path, 'ab') as f:
+                    offset = f.tell()
+                    f.write(member)
+                segment, length, revisit = segment_path.name, len(member), 0
+
+            cursor = self.conn.execute(
+                "INSERT INTO records (url, fetched_at, status_code, content_type, content_hash, segment, offset, length, revisit) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, fetched_at, status_code, content_type, body_hash, segment, offset, length, revisit))
+            self.conn.commit()
+            return cursor.lastrowid, bool(revisit)
+
+    def records(self, url=None, since=None, until=None, limit=None):
+        query = "SELECT * FROM records WHERE 1=1"
+        params = []
+        if url:
+            query += " AND url = ?"
+            params.append(url)
+        if since:
+            query += " AND fetched_at >= ?"
+            params.append(since)
+        if until:
+            query += " AND fetched_at < ?"
+            params.append(until)
+        query += " ORDER BY fetched_at DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(query, params).fetchall()]
+
+    def read(self, record_id):
+        """(record row, body bytes) for one archived fetch"""
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM records WHERE id = ?", (record_id,)).fetchone()
+        if not row:
+            return None, None
+        _, body = read_record(self.archive_dir / row["segment"], row["offset"], row["length"])
+        return dict(row), body
+
+    def _unique_bodies(self, url=None, since=None, until=None, page_size=1000):
+        """(content_hash, url, content_type, segment, offset, length) of the newest record per body, paged"""
+        query = ("SELECT content_hash, url, content_type, segment, offset, length, MAX(fetched_at) "
+                 "FROM records WHERE 1=1")
+        params = []
+        if url:
+            query += " AND url = ?"
+            params.append(url)
+        if since:
+            query += " AND fetched_at >= ?"
+            params.append(since)
+        if until:
+            query += " AND fetched_at < ?"
+            params.append(until)
+        query += " GROUP BY content_hash"
+        with self.lock:
+            cursor = self.conn.execute(query, params)
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(page_size)
+            if not rows:
+                return
+            yield [tuple(row)[:6] for row in rows]
+
+    def reanalyze(self, url=None, since=None, until=None, analyzer=analyze_archived_page,
+                  workers=None, batch_size=REANALYZE_BATCH):
+        """Run analyzer over archived pages (each unique body once) across a process pool
+
+        Yields (content_hash, url, analysis, error) as batches complete; at most
+        2 * workers batches are in flight, so memory does not grow with the archive.
+        """
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = []
+            for page in self._unique_bodies(url, since, until, page_size=batch_size):
+                pending.append(executor.submit(_reanalyze_batch, str(self.archive_dir), page, analyzer))
+                if len(pending) >= workers * 2:
+                    yield from pending.pop(0).result()
+            for future in pending:
+                yield from future.result()
+
+    def stats(self):
+        with self.lock:
+            records = self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+            unique = self.conn.execute("SELECT COUNT(*) FROM records WHERE revisit = 0").fetchone()[0]
+        segments = list(self.archive_dir.glob("archive-*.warc.gz"))
+        return {
+            "records": records,
+            "unique_bodies": unique,
+            "segments": len(segments),
+            "archive_bytes": sum(p.stat().st_size for p in segments)
+        }
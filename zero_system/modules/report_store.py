@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+ZERO REPORT STORE - Aggregated web-analysis log (SQLite)
+One database instead of one JSON file per request: reports are indexed by
+URL and time, page analyses are de-duplicated by content hash.
+"""
+
+import json
+import hashlib
+import sqlite3
+import threading
+import urllib.parse
+from pathlib import Path
+from datetime import datetime
+
+# Field per-request; sisanya adalah analisis halaman yang bisa di-dedup
+REQUEST_FIELDS = ("url", "status_code", "content_type", "headers", "timings")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    content_hash TEXT PRIMARY KEY,
+    analysis TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    status_code INTEGER,
+    content_type TEXT,
+    headers TEXT,
+    timings TEXT,
+    content_hash TEXT NOT NULL REFERENCES pages(content_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_reports_url_time ON reports(url, fetched_at);
+CREATE INDEX IF NOT EXISTS idx_reports_time ON reports(fetched_at);
+CREATE INDEX IF NOT EXISTS idx_reports_hash ON reports(content_hash);
+"""
+
+
+def content_hash(content):
+    """SHA-256 of the raw page body (bytes or str)"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content or b"").hexdigest()
+
+
+class ReportStore:
+    """Append-only SQLite store for web analysis reports"""
+
+    def __init__(self, path="data/web_reports.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.conn.commit()
+
+    def _migrate(self):
+        """Add columns introduced after a database was created"""
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(reports)")}
+        if "timings" not in columns:
+            self.conn.execute("ALTER TABLE reports ADD COLUMN timings TEXT")
+
+    def _insert_report(self, analysis_result, page_hash, fetched_at):
+        cursor = self.conn.execute(
+            "INSERT INTO reports (url, fetched_at, status_code, content_type, headers, timings, content_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (analysis_result.get("url"), fetched_at, analysis_result.get("status_code"),
+             analysis_result.get("content_type"), json.dumps(analysis_result.get("headers", {})),
+             json.dumps(analysis_result.get("timings")) if analysis_result.get("timings") else None,
+             page_hash))
+        return cursor.lastrowid
+
+    def add(self, analysis_result, content, fetched_at=None):
+        """Store one report; returns (report_id, duplicate_page)"""
+        page_hash = content_hash(content)
+        fetched_at = fetched_at or datetime.now().isoformat()
+        page_analysis = {k: v for k, v in analysis_result.items() if k not in REQUEST_FIELDS}
+
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE pages SET hits = hits + 1 WHERE content_hash = ?", (page_hash,))
+            duplicate = cursor.rowcount > 0
+            if not duplicate:
+                self.conn.execute(
+                    "INSERT INTO pages (content_hash, analysis, first_seen) VALUES (?, ?, ?)",
+                    (page_hash, json.dumps(page_analysis, ensure_ascii=False), fetched_at))
+            report_id = self._insert_report(analysis_result, page_hash, fetched_at)
+            self.conn.commit()
+            return report_id, duplicate
+
+    def add_reference(self, analysis_result, page_hash, fetched_at=None):
+        """Store a report that reuses an already stored page analysis (near-duplicate fetch)"""
+        fetched_at = fetched_at or datetime.now().isoformat()
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE pages SET hits = hits + 1 WHERE content_hash = ?", (page_hash,))
+            if cursor.rowcount == 0:
+                return None
+            report_id = self._insert_report(analysis_result, page_hash, fetched_at)
+            self.conn.commit()
+            return report_id
+
+    def update_analysis(self, page_hash, analysis_result):
+        """Replace the stored page analysis (e.g. after a re-analysis run)"""
+        page_analysis = {k: v for k, v in analysis_result.items() if k not in REQUEST_FIELDS}
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE pages SET analysis = ? WHERE content_hash = ?",
+                (json.dumps(page_analysis, ensure_ascii=False), page_hash))
+            self.conn.commit()
+            return cursor.rowcount > 0
+
+    def _row_to_report(self, row):
+        """Rebuild the legacy per-file report dict"""
+        report = {
+            "url": row["url"],
+            "status_code": row["status_code"],
+            "content_type": row["content_type"],
+            "content_length": None,
+            "headers": json.loads(row["headers"] or "{}")
+        }
+        report.update(json.loads(row["analysis"]))
+        if row["timings"]:
+            report["timings"] = json.loads(row["timings"])
+        return report
+
+    def get(self, report_id):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT r.*, p.analysis FROM reports r JOIN pages p USING (content_hash) WHERE r.id = ?",
+                (report_id,)).fetchone()
+        return self._row_to_report(row) if row else None
+
+    def _select(self, columns, url=None, since=None, until=None, limit=None):
+        query = f"SELECT {columns} FROM reports r JOIN pages p USING (content_hash) WHERE 1=1"
+        params = []
+        if url:
+            query += " AND r.url = ?"
+            params.append(url)
+        if since:
+            query += " AND r.fetched_at >= ?"
+            params.append(since)
+        if until:
+            query += " AND r.fetched_at < ?"
+            params.append(until)
+        query += " ORDER BY r.fetched_at DESC, r.id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self.lock:
+            return self.conn.execute(query, params).fetchall()
+
+    def history(self, url=None, since=None, until=None, limit=50):
+        """Report summaries, newest first"""
+        rows = self._select("r.id, r.url, r.fetched_at, r.status_code, r.content_hash, p.hits",
+                            url, since, until, limit)
+        return [dict(row) for row in rows]
+
+    def timings(self, since=None, limit=5000):
+        """[(host, timings)] of recent reports, for per-host percentiles"""
+        query = "SELECT url, timings FROM reports WHERE timings IS NOT NULL"
+        params = []
+        if since:
+            query += " AND fetched_at >= ?"
+            params.append(since)
+        query += " ORDER BY fetched_at DESC LIMIT ?"
+        params.append(limit)
+        with self.lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [(urllib.parse.urlsplit(row["url"]).netloc.lower(), json.loads(row["timings"])) for row in rows]
+
+    def export(self, output_dir="reports", url=None, since=None, until=None):
+        """Write reports back out as reports/web_analysis_{timestamp}_{id}.json (old format + report id)
+
+        File names depend only on the report, so exporting again overwrites instead of duplicating.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        exported = 0
+        for row in self._select("r.*, p.analysis", url, since, until):
+            timestamp = datetime.fromisoformat(row["fetched_at"]).strftime("%Y%m%d_%H%M%S")
+            report_path = output_dir / f"web_analysis_{timestamp}_{row['id']}.json"
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(self._row_to_report(row), f, indent=2)
+            exported += 1
+        return exported
+
+    def stats(self):
+        with self.lock:
+            reports = self.conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+            pages = self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            urls = self.conn.execute("SELECT COUNT(DISTINCT url) FROM reports").fetchone()[0]
+        return {"reports": reports, "unique_pages": pages, "urls": urls,
+                "duplicates_saved": reports - pages}
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
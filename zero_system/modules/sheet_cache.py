@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+ZERO SHEET CACHE - Parsed spreadsheet cache keyed by file fingerprint
+A parsed sheet is stored once as typed NumPy columns (pickle protocol 5);
+later reads of the same path + sheet skip the XML parse entirely. Entries
+carry the workbook's mtime and size, so an edited workbook re-parses.
+"""
+
+import os
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime
+
+import numpy as np
+
+from zero_system.modules.excel_io import iter_excel_rows
+
+CACHE_FORMAT = 1
+MAX_ENTRIES = 256
+
+# Tipe sel yang disimpan sebagai kolom NumPy bertipe; sisanya kolom object
+TYPED_COLUMNS = {
+    int: (np.int64, 0),
+    float: (np.float64, np.nan),
+    bool: (np.bool_, False),
+    datetime: ("datetime64[us]", np.datetime64("NaT")),
+}
+
+
+def _to_column(values):
+    """(array, missing mask or None) for one column of cell values"""
+    missing = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    kinds = {type(v) for v in values if v is not None}
+    mask = missing if missing.any() else None
+    if len(kinds) == 1:
+        dtype, fill = TYPED_COLUMNS.get(kinds.pop(), (None, None))
+        if dtype is not None:
+            try:
+                return np.array([fill if v is None else v for v in values], dtype=dtype), mask
+            except (OverflowError, ValueError):
+                pass  # mis. integer di luar int64
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column, None
+
+
+def rows_to_columns(rows):
+    """Compact column payload of a parsed sheet (first row kept apart as the header)"""
+    header = list(rows[0]) if rows else None
+    body = rows[1:]
+    width = max((len(row) for row in body), default=0)
+    lengths = np.fromiter((len(row) for row in body), dtype=np.int32, count=len(body))
+    columns, masks = [], []
+    for i in range(width):
+        column, mask = _to_column([row[i] if i < len(row) else None for row in body])
+        columns.append(column)
+        masks.append(mask)
+    return {"format": CACHE_FORMAT, "header": header, "columns": columns, "masks": masks,
+            "lengths": None if (lengths == width).all() else lengths, "rows": len(body)}
+
+
+def columns_to_rows(payload):
+    """Rebuild the list-of-lists rows a fresh parse would have returned"""
+    if payload["header"] is None:
+        return []
+    lists = []
+    for column, mask in zip(payload["columns"], payload["masks"]):
+        values = column.tolist()
+        if mask is not None:
+            for i in np.flatnonzero(mask).tolist():
+                values[i] = None
+        lists.append(values)
+    body = [list(row) for row in zip(*lists)] if lists else [[] for _ in range(payload["rows"])]
+    if payload["lengths"] is not None:
+        body = [row[:length] for row, length in zip(body, payload["lengths"].tolist())]
+    return [payload["header"]] + body
+
+
+def file_fingerprint(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SheetCache:
+    """On-disk cache of parsed sheets, one pickle per (path, sheet, column projection)"""
+
+    def __init__(self, cache_dir="data/sheet_cache", max_entries=MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0}
+
+    def _entry_path(self, path, sheet, columns):
+        key = f"{Path(path).resolve()}|{sheet!r}|{columns!r}"
+        return self.cache_dir / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.pkl"
+
+    def get(self, path, sheet=None, columns=None):
+        """Cached column payload, or None when missing or the workbook changed"""
+        entry_path = self._entry_path(path, sheet, columns)
+        try:
+            with open(entry_path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            return None
+        if entry.get("fingerprint") != file_fingerprint(path) or entry["payload"].get("format") != CACHE_FORMAT:
+            return None
+        return entry["payload"]
+
+    def put(self, path, payload, sheet=None, columns=None, fingerprint=None):
+        entry_path = self._entry_path(path, sheet, columns)
+        entry = {"path": str(path), "sheet": sheet, "fingerprint": fingerprint or file_fingerprint(path),
+                 "payload": payload}
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(entry, f, protocol=5)
+        os.replace(tmp_path, entry_path)
+        self._evict()
+
+    def _evict(self):
+        entries = sorted(self.cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-self.max_entries]:
+            stale.unlink(missing_ok=True)
+
+    def read_columns(self, path, sheet=None, columns=None):
+        """(payload, cached) - parses and stores the sheet on a miss"""
+        payload = self.get(path, sheet, columns)
+        with self.lock:
+            self.counters["hits" if payload is not None else "misses"] += 1
+        if payload is not None:
+            return payload, True
+        # Fingerprint diambil sebelum parse: perubahan selama parse tidak ikut ter-cache
+        fingerprint = file_fingerprint(path)
+        payload = rows_to_columns(list(iter_excel_rows(path, sheet=sheet, columns=columns)))
+        self.put(path, payload, sheet, columns, fingerprint)
+        return payload, False
+
+    def read(self, path, sheet=None, columns=None):
+        """(rows, cached) - same rows as iter_excel_rows, served from the cache when fresh"""
+        payload, cached = self.read_columns(path, sheet, columns)
+        return columns_to_rows(payload), cached
+
+    def clear(self):
+        for entry_path in self.cache_dir.glob("*.pkl"):
+            entry_path.unlink(missing_ok=True)
+
+    def stats(self):
+        with self.lock:
+            counters = dict(self.counters)
+        entries = list(self.cache_dir.glob("*.pkl"))
+        return {**counters, "entries": len(entries),
+                "bytes": sum(p.stat().st_size for p in entries)}
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+ZERO SHEET INGEST - Parallel multi-file / multi-sheet spreadsheet ingestion
+Workbooks are parsed across a process pool; each worker returns compact
+column payloads (through the sheet cache) and the parent concatenates them
+column by column, aligning schemas by header name.
+"""
+
+import os
+import glob
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from zero_system.modules.excel_io import sheet_names
+from zero_system.modules.sheet_cache import SheetCache, CACHE_FORMAT
+
+SOURCE_COLUMNS = ("source_file", "source_sheet")
+
+
+def _ingest_workbook(path, all_sheets, cache_dir):
+    """Worker: [(sheet, payload, cached, error)] for one workbook"""
+    cache = SheetCache(cache_dir)
+    try:
+        sheets = sheet_names(path) if all_sheets else [None]
+    except Exception as e:
+        return [(None, None, False, str(e))]
+    results = []
+    for sheet in sheets:
+        try:
+            payload, cached = cache.read_columns(path, sheet=sheet)
+            results.append((sheet, payload, cached, None))
+        except Exception as e:
+            results.append((sheet, None, False, str(e)))
+    return results
+
+
+def _column_names(header):
+    """Usable, unique column names from a header row"""
+    names, seen = [], {}
+    for i, name in enumerate(header or []):
+        name = f"column_{i + 1}" if name is None or name == "" else str(name)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _object_column(values, count):
+    column = np.empty(count, dtype=object)
+    column[:] = values
+    return column
+
+
+def concat_payloads(parts):
+    """Concatenate (source_file, source_sheet, payload) parts into one payload
+
+    Columns are matched by header name (union, first-seen order). A column
+    keeps its NumPy dtype when every part that has it agrees; otherwise it
+    falls back to object. Parts without a column get masked empty cells.
+    """
+    if not parts:
+        return {"format": CACHE_FORMAT, "header": None, "columns": [], "masks": [], "lengths": None, "rows": 0}
+    names = list(SOURCE_COLUMNS)
+    aligned = []
+    for source_file, source_sheet, payload in parts:
+        width = len(payload["columns"])
+        header_names = _column_names((payload["header"] or []) + [None] * max(0, width - len(payload["header"] or [])))
+        by_name = {}
+        for name, column, mask in zip(header_names, payload["columns"], payload["masks"]):
+            by_name[name] = (column, mask)
+            if name not in names:
+                names.append(name)
+        count = payload["rows"]
+        by_name["source_file"] = (_object_column([source_file] * count, count), None)
+        by_name["source_sheet"] = (_object_column([source_sheet] * count, count), None)
+        aligned.append((count, by_name))
+
+    columns, masks = [], []
+    for name in names:
+        present = [by_name[name][0].dtype for _, by_name in aligned if name in by_name]
+        dtype = present[0] if all(d == present[0] for d in present) else np.dtype(object)
+        pieces, mask_pieces = [], []
+        for count, by_name in aligned:
+            if name in by_name:
+                column, mask = by_name[name]
+                pieces.append(column.astype(dtype, copy=False))
+                mask_pieces.append(mask if mask is not None else np.zeros(count, dtype=bool))
+            else:
+                pieces.append(np.zeros(count, dtype=dtype) if dtype != object else _object_column([None] * count, count))
+                mask_pieces.append(np.ones(count, dtype=bool))
+        columns.append(np.concatenate(pieces))
+        mask = np.concatenate(mask_pieces)
+        masks.append(mask if mask.any() else None)
+
+    rows = sum(count for count, _ in aligned)
+    return {"format": CACHE_FORMAT, "header": names,
+            "columns": columns, "masks": masks, "lengths": None, "rows": rows}
+
+
+def ingest_spreadsheets(pattern, all_sheets=False, workers=None, cache_dir="data/sheet_cache"):
+    """Parse every workbook matching a glob (optionally every sheet) in parallel
+
+    Returns (payload, sheets): one schema-aligned column payload plus a list
+    of per-sheet reports {file, sheet, rows, cached, error}.
+    """
+    paths = sorted(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths) or 1))
+    parts, sheets = [], []
+
+    def collect(path, results):
+        for sheet, payload, cached, error in results:
+            sheets.append({"file": path, "sheet": sheet, "rows": payload["rows"] if payload else 0,
+                           "cached": cached, "error": error})
+            if payload is not None and payload["header"] is not None:
+                parts.append((path, sheet, payload))
+
+    if workers == 1:
+        for path in paths:
+            collect(path, _ingest_workbook(path, all_sheets, cache_dir))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Hasil dikumpulkan sesuai urutan file agar output deterministik
+            futures = [(path, executor.submit(_ingest_workbook, path, all_sheets, cache_dir)) for path in paths]
+            for path, future in futures:
+                collect(path, future.result())
+    return concat_payloads(parts), sheets
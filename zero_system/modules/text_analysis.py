@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+ZERO TEXT ANALYSIS - Shared HTML and text analyzers
+Module-level functions so they can run in worker processes as well as in
+ZeroEnhanced.advanced_text_analysis / analyze_web_response.
+"""
+
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from zero_system.modules import nltk_resources
+from zero_system.modules.text_stats import get_engine
+from zero_system.modules.keyword_index import document_key
+from zero_system.modules.analysis_cache import AnalysisCache, text_key
+
+# Naikkan setiap kali hasil analyze_text berubah untuk teks yang sama
+ANALYZER_VERSION = "2"
+
+CORPUS_BATCH = 64
+CORPUS_TOP_KEYWORDS = 20
+
+STREAM_CHUNK_CHARS = 1024 * 1024
+STREAM_KEYWORD_CAPACITY = 200000   # distinct keywords kept while streaming
+STREAM_SENTIMENT_SAMPLES = 64      # chunks scored by VADER
+STREAM_SENTIMENT_SNIPPET = 4000    # characters scored per sampled chunk
+
+_sentiment_analyzer = None
+_sentiment_loaded = False
+
+
+def get_sentiment_analyzer():
+    """Per-process VADER analyzer, built on first use; None if NLTK / the lexicon is not installed locally"""
+    global _sentiment_analyzer, _sentiment_loaded
+    if not _sentiment_loaded:
+        _sentiment_loaded = True
+        _sentiment_analyzer = None
+        if nltk_resources.is_available("vader_lexicon"):
+            try:
+                from nltk.sentiment import SentimentIntensityAnalyzer
+                _sentiment_analyzer = SentimentIntensityAnalyzer()
+            except Exception:
+                _sentiment_analyzer = None
+    return _sentiment_analyzer
+
+
+def reset_sentiment_analyzer():
+    """Forget the cached analyzer (e.g. after NLTK data was fetched)"""
+    global _sentiment_analyzer, _sentiment_loaded
+    _sentiment_analyzer = None
+    _sentiment_loaded = False
+
+
+_analysis_cache = None
+
+
+def get_analysis_cache():
+    """Process-wide memo cache (RAM only unless replaced via set_analysis_cache)"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        _analysis_cache = AnalysisCache()
+    return _analysis_cache
+
+
+def set_analysis_cache(cache):
+    global _analysis_cache
+    _analysis_cache = cache
+
+
+def analyzer_config():
+    """Analyzer version + stopword configuration; cached results from other configs never match"""
+    return f"v{ANALYZER_VERSION}|stopwords={get_engine().signature}"
+
+
+def analyze_text(text_content, sentiment_analyzer=None, keyword_index=None, trends=None):
+    """Basic stats, VADER sentiment and top keywords for one text
+
+    With a KeywordIndex the text is counted into the document frequencies
+    and "tfidf_keywords" ranks its terms against everything indexed so far;
+    a TrendTracker receives the keyword counts for trending windows.
+    """
+    analysis, keywords = _cached_analysis(text_content, sentiment_analyzer)
+    if trends is not None:
+        trends.add(keywords)
+    if keyword_index is not None:
+        keyword_index.add_document(keywords, document_key(text_content))
+        analysis["tfidf_keywords"] = keyword_index.tfidf(keywords)
+    return analysis
+
+
+def _cached_analysis(text_content, sentiment_analyzer=None):
+    """_analyze_with_counts through the memo cache (VADER scoring is the expensive part)"""
+    cache = get_analysis_cache()
+    config = analyzer_config()
+    key = text_key(text_content, f"{config}|sentiment={sentiment_analyzer is not None}")
+    cached = cache.get(key, config)
+    if cached is not None:
+        return cached["analysis"], Counter(cached["keywords"])
+    analysis, keywords = _analyze_with_counts(text_content, sentiment_analyzer)
+    cache.put(key, config, {"analysis": analysis, "keywords": keywords})
+    return analysis, keywords
+
+
+def _analyze_with_counts(text_content, sentiment_analyzer=None):
+    """analyze_text plus the full keyword Counter (needed to merge corpora exactly)"""
+    stats = get_engine().scan(text_content)
+    analysis = {
+        "basic_stats": stats.basic_stats(),
+        "sentiment": {},
+        "keywords": dict(stats.keywords.most_common(10)),
+        "readability": {}
+    }
+
+    # Sentiment analysis
+    if sentiment_analyzer:
+        sentiment_scores = sentiment_analyzer.polarity_scores(text_content)
+        analysis["sentiment"] = {
+            "compound": sentiment_scores['compound'],
+            "positive": sentiment_scores['pos'],
+            "negative": sentiment_scores['neg'],
+            "neutral": sentiment_scores['neu'],
+            "overall_sentiment": "positive" if sentiment_scores['compound'] > 0.1 else "negative" if sentiment_scores['compound'] < -0.1 else "neutral"
+        }
+
+    return analysis, stats.keywords
+
+
+def _empty_corpus_stats():
+    return {
+        "documents": 0,
+        "totals": {"lines": 0, "words": 0, "characters": 0, "sentences": 0},
+        "sentiment": {"scored": 0, "compound_sum": 0.0, "positive": 0, "negative": 0, "neutral": 0},
+        "keywords": Counter(),
+        "results": [],
+        "errors": []
+    }
+
+
+def merge_corpus_stats(target, partial):
+    """Fold one partial corpus aggregate into another (both from _analyze_batch)"""
+    target["documents"] += partial["documents"]
+    for key, value in partial["totals"].items():
+        target["totals"][key] += value
+    for key, value in partial["sentiment"].items():
+        target["sentiment"][key] += value
+    target["keywords"].update(partial["keywords"])
+    target["results"].extend(partial["results"])
+    target["errors"].extend(partial["errors"])
+    return target
+
+
+def _analyze_batch(batch, read_files):
+    """Worker: analyze a batch of (doc_id, text-or-path) and pre-merge it"""
+    stats = _empty_corpus_stats()
+    sentiment_analyzer = get_sentiment_analyzer()
+    for doc_id, item in batch:
+        try:
+            if read_files:
+                with open(item, 'r', encoding='utf-8', errors='replace') as f:
+                    item = f.read()
+            analysis, word_freq = _cached_analysis(item, sentiment_analyzer)
+        except Exception as e:
+            stats["errors"].append({"document": doc_id, "error": str(e)})
+            continue
+
+        basic = analysis["basic_stats"]
+        stats["documents"] += 1
+        stats["totals"]["lines"] += basic["total_lines"]
+        stats["totals"]["words"] += basic["total_words"]
+        stats["totals"]["characters"] += basic["total_characters"]
+        stats["totals"]["sentences"] += basic["total_sentences"]
+        stats["keywords"].update(word_freq)
+        if analysis["sentiment"]:
+            stats["sentiment"]["scored"] += 1
+            stats["sentiment"]["compound_sum"] += analysis["sentiment"]["compound"]
+            stats["sentiment"][analysis["sentiment"]["overall_sentiment"]] += 1
+        stats["results"].append({"document": doc_id, **analysis})
+    return stats
+
+
+def _corpus_batches(documents, batch_size):
+    batch = []
+    for index, document in enumerate(documents):
+        batch.append(document if isinstance(document, tuple) else (index, document))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def analyze_corpus(documents, workers=None, batch_size=CORPUS_BATCH, read_files=False,
+                   top_keywords=CORPUS_TOP_KEYWORDS):
+    """Analyze many documents across a process pool and merge the results
+
+    documents: iterable of texts or (doc_id, text) tuples; with read_files=True
+    the items are file paths (or (doc_id, path)) read inside the workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    merged = _empty_corpus_stats()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Batasi jumlah batch yang antre supaya iterable besar tidak dimuat sekaligus
+        pending = []
+        for batch in _corpus_batches(documents, batch_size):
+            pending.append(executor.submit(_analyze_batch, batch, read_files))
+            if len(pending) >= workers * 2:
+                merge_corpus_stats(merged, pending.pop(0).result())
+        for future in pending:
+            merge_corpus_stats(merged, future.result())
+
+    totals = merged["totals"]
+    sentiment = merged["sentiment"]
+    documents_count = merged["documents"]
+    corpus = {
+        "documents": documents_count,
+        "errors": merged["errors"],
+        "basic_stats": {
+            "total_lines": totals["lines"],
+            "total_words": totals["words"],
+            "total_characters": totals["characters"],
+            "total_sentences": totals["sentences"],
+            "avg_words_per_document": totals["words"] / documents_count if documents_count else 0,
+            "avg_words_per_line": totals["words"] / totals["lines"] if totals["lines"] else 0,
+            "avg_words_per_sentence": totals["words"] / totals["sentences"] if totals["sentences"] else 0
+        },
+        "sentiment": {},
+        "keywords": dict(merged["keywords"].most_common(top_keywords)),
+        "results": merged["results"]
+    }
+    if sentiment["scored"]:
+        mean_compound = sentiment["compound_sum"] / sentiment["scored"]
+        corpus["sentiment"] = {
+            "mean_compound": mean_compound,
+            "positive_documents": sentiment["positive"],
+            "negative_documents": sentiment["negative"],
+            "neutral_documents": sentiment["neutral"],
+            "overall_sentiment": "positive" if mean_compound > 0.1 else "negative" if mean_compound < -0.1 else "neutral"
+        }
+    return corpus
+
+
+def _stream_segments(f, chunk_chars):
+    """Yield text segments that end on whitespace, so no word is split across two segments"""
+    carry = ""
+    while True:
+        chunk = f.read(chunk_chars)
+        if not chunk:
+            break
+        buffer = carry + chunk
+        cut = len(buffer)
+        while cut and not buffer[cut - 1].isspace():
+            cut -= 1
+        if cut == 0 and len(buffer) < 4 * chunk_chars:
+            carry = buffer  # token belum selesai, tunggu chunk berikutnya
+            continue
+        cut = cut or len(buffer)
+        yield buffer[:cut]
+        carry = buffer[cut:]
+    if carry:
+        yield carry
+
+
+def analyze_file(path, sentiment_analyzer=None, chunk_chars=STREAM_CHUNK_CHARS,
+                 keyword_capacity=STREAM_KEYWORD_CAPACITY, sentiment_samples=STREAM_SENTIMENT_SAMPLES,
+                 keyword_index=None, trends=None):
+    """analyze_text for a file of any size, streamed in chunks with bounded memory
+
+    Line / word / character / sentence counts match analyze_text; keywords are exact
+    until keyword_capacity distinct words are seen, then the rare tail is
+    pruned; sentiment is the mean over a reservoir sample of chunks.
+    """
+    stats = get_engine().stats()
+    samples = []
+    rng = random.Random(0)
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for index, segment in enumerate(_stream_segments(f, chunk_chars)):
+            stats.feed(segment)
+            if len(stats.keywords) > keyword_capacity:
+                stats.keywords = Counter(dict(stats.keywords.most_common(keyword_capacity // 2)))
+
+            if sentiment_analyzer:
+                # Reservoir sampling: setiap chunk punya peluang sama untuk dinilai
+                snippet = segment[:STREAM_SENTIMENT_SNIPPET]
+                if len(samples) < sentiment_samples:
+                    samples.append(snippet)
+                else:
+                    slot = rng.randint(0, index)
+                    if slot < sentiment_samples:
+                        samples[slot] = snippet
+
+    analysis = {
+        "basic_stats": stats.basic_stats(),
+        "sentiment": {},
+        "keywords": dict(stats.keywords.most_common(10)),
+        "readability": {}
+    }
+
+    if sentiment_analyzer and samples:
+        scores = [sentiment_analyzer.polarity_scores(snippet) for snippet in samples]
+        compound = sum(s['compound'] for s in scores) / len(scores)
+        analysis["sentiment"] = {
+            "compound": compound,
+            "positive": sum(s['pos'] for s in scores) / len(scores),
+            "negative": sum(s['neg'] for s in scores) / len(scores),
+            "neutral": sum(s['neu'] for s in scores) / len(scores),
+            "overall_sentiment": "positive" if compound > 0.1 else "negative" if compound < -0.1 else "neutral",
+            "sampled_chunks": len(scores)
+        }
+
+    if trends is not None:
+        trends.add(stats.keywords)
+    if keyword_index is not None:
+        file_stat = os.stat(path)
+        file_key = document_key(f"{os.path.abspath(path)}:{file_stat.st_size}:{file_stat.st_mtime_ns}")
+        keyword_index.add_document(stats.keywords, file_key)
+        analysis["tfidf_keywords"] = keyword_index.tfidf(stats.keywords)
+
+    return analysis
+
+
+def parse_html_page(html):
+    """HTML summary (title, images, links, forms), the extracted page text and the raw link hrefs"""
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.find('title')
+    anchors = soup.find_all('a')
+    summary = {
+        "title": title.text.strip() if title else "No title",
+        "images": len(soup.find_all('img')),
+        "links": len(anchors),
+        "forms": len(soup.find_all('form'))
+    }
+    hrefs = [a.get('href') for a in anchors if a.get('href')]
+    return summary, soup.get_text(), hrefs
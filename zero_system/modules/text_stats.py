@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+ZERO TEXT STATS - Shared tokenizer / statistics engine
+One tokenization (lower().split()) yields both the word count and the raw
+token counts; keyword normalization and stopword filtering then run once per
+distinct token instead of once per word. Sentences use a precompiled pattern
+and lines a plain count, so no intermediate line or sentence lists are built.
+Texts can be fed in segments (see TextStats.feed) for streaming analysis.
+"""
+
+import os
+import re
+import hashlib
+from collections import Counter
+
+# Satu "kalimat" = potongan di antara [.!?]+ yang berisi karakter non-spasi
+SENTENCE_PATTERN = re.compile(r'[^\s.!?][^.!?]*')
+SENTENCE_DELIMITERS = ".!?"
+KEYWORD_STRIP = '.,!?;:"\'()[]{}<>*“”‘’«»'
+MIN_KEYWORD_LENGTH = 4
+
+STOPWORDS = {
+    "english": frozenset("""
+        a about above after again against all also am an and any are aren't as at be because been before being
+        below between both but by can can't cannot could couldn't did didn't do does doesn't doing don't down
+        during each few for from further get got had hadn't has hasn't have haven't having he her here hers
+        herself him himself his how however i if in into is isn't it it's its itself just let's like made make
+        many may me might more most much must mustn't my myself new no nor not now of off on once one only or
+        other ought our ours ourselves out over own said same say says she should shouldn't since so some still
+        such than that that's the their theirs them themselves then there there's these they this those through
+        to too under until up upon us use used using very via was wasn't we well were weren't what when where
+        whether which while who whom whose why will with within without won't would wouldn't yet you your yours
+        yourself yourselves
+    """.split()),
+    "indonesian": frozenset("""
+        ada adalah adanya agar akan akhirnya aku anda antara apa apabila apakah atau atas bagai bagaimana bagi
+        bahkan bahwa banyak baru beberapa begitu belum berada berbagai bisa boleh bukan dalam dan dapat dari
+        daripada demikian dengan di dia dilakukan dirinya doang harus hal hampir hanya hingga ia ialah ini
+        itu jadi jika juga jangan kalau kami kamu kan karena ke kecuali kembali kemudian kenapa kepada ketika
+        kita lagi lain lalu lebih maka mana masih mau melainkan melalui memang mengapa menjadi mereka meski
+        meskipun mungkin namun nanti nya oleh pada padahal para pernah perlu pula pun saat saja sama sambil
+        sampai sangat saya sebagai sebelum sebuah secara sedang sedangkan sehingga sejak sekarang selain
+        selama seluruh semua sendiri seperti serta sesuatu setelah setiap sudah supaya tanpa tapi tentang
+        tersebut tetapi tidak untuk walau walaupun yaitu yakni yang
+    """.split())
+}
+
+DEFAULT_LANGUAGES = tuple(
+    lang.strip() for lang in os.environ.get("ZERO_STOPWORDS", "english,indonesian").split(",") if lang.strip())
+
+
+def register_stopwords(language, words):
+    """Add (or replace) a stopword list usable by TextStatsEngine(languages=...)"""
+    STOPWORDS[language] = frozenset(w.lower() for w in words)
+
+
+class TextStatsEngine:
+    """Precompiled patterns + stopword set; stateless, safe to share between threads"""
+
+    def __init__(self, languages=DEFAULT_LANGUAGES, min_keyword_length=MIN_KEYWORD_LENGTH, extra_stopwords=()):
+        self.languages = tuple(languages)
+        self.min_keyword_length = min_keyword_length
+        self.stopwords = frozenset().union(*(STOPWORDS[lang] for lang in self.languages),
+                                           (w.lower() for w in extra_stopwords))
+        # Berubah bila stopword / panjang minimum berubah (dipakai sebagai kunci cache)
+        self.signature = hashlib.sha1(
+            f"{min_keyword_length}|{'|'.join(sorted(self.stopwords))}".encode("utf-8")).hexdigest()[:16]
+
+    def keywords(self, tokens):
+        """Stopword-filtered keyword Counter from already lower-cased tokens"""
+        keywords = Counter()
+        for token, count in Counter(tokens).items():
+            # Normalisasi per token unik, bukan per kemunculan
+            word = token.strip(KEYWORD_STRIP)
+            if len(word) >= self.min_keyword_length and word not in self.stopwords and not word.isdigit():
+                keywords[word] += count
+        return keywords
+
+    def stats(self):
+        """Empty accumulator to feed() segments into"""
+        return TextStats(self)
+
+    def scan(self, text):
+        """Statistics of one complete text"""
+        stats = TextStats(self)
+        stats.feed(text)
+        return stats
+
+
+class TextStats:
+    """Running counts over one text, fed whole or in whitespace-aligned segments"""
+
+    __slots__ = ("engine", "newlines", "words", "characters", "sentences", "keywords", "_open_sentence")
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.newlines = 0
+        self.words = 0
+        self.characters = 0
+        self.sentences = 0
+        self.keywords = Counter()
+        self._open_sentence = False
+
+    def feed(self, segment):
+        """Add one segment; segments must be cut at whitespace so no word spans two"""
+        tokens = segment.lower().split()
+        self.newlines += segment.count('\n')
+        self.characters += len(segment)
+        self.words += len(tokens)
+
+        stripped = segment.strip()
+        if stripped:
+            sentences = len(SENTENCE_PATTERN.findall(segment))
+            # Kalimat yang belum ditutup di segmen sebelumnya berlanjut di sini
+            if self._open_sentence and stripped[0] not in SENTENCE_DELIMITERS:
+                sentences -= 1
+            self.sentences += sentences
+            self._open_sentence = stripped[-1] not in SENTENCE_DELIMITERS
+            self.keywords.update(self.engine.keywords(tokens))
+        return self
+
+    @property
+    def lines(self):
+        return self.newlines + 1
+
+    def basic_stats(self):
+        return {
+            "total_lines": self.lines,
+            "total_words": self.words,
+            "total_characters": self.characters,
+            "total_sentences": self.sentences,
+            "avg_words_per_line": self.words / self.lines,
+            "avg_words_per_sentence": self.words / self.sentences if self.sentences else 0
+        }
+
+
+_default_engine = None
+
+
+def get_engine():
+    """Process-wide engine built from DEFAULT_LANGUAGES"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = TextStatsEngine()
+    return _default_engine
+
+
+def set_engine(engine):
+    """Swap the process-wide engine (e.g. different stopword languages)"""
+    global _default_engine
+    _default_engine = engine
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+ZERO TRENDING - Bounded-memory trending keywords
+SpaceSaving heavy-hitter summaries per hour and per day bucket. Each
+summary tracks at most `capacity` keywords and only the most recent
+buckets are kept, so memory stays fixed however much text flows in.
+"""
+
+import os
+import json
+import heapq
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+
+HOUR_FORMAT = "%Y-%m-%dT%H"
+DAY_FORMAT = "%Y-%m-%d"
+WINDOWS = {"hour": ("hour", 1), "24h": ("hour", 24), "day": ("day", 1), "7d": ("day", 7), "30d": ("day", 30)}
+
+
+class SpaceSaving:
+    """Top-k counter: estimates never undercount, overcount is bounded by error"""
+
+    def __init__(self, capacity=500):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.heap = []   # (count, item), entri lama dibuang secara lazy
+
+    def _push(self, item):
+        heapq.heappush(self.heap, (self.counts[item], item))
+        if len(self.heap) > 4 * self.capacity:
+            self.heap = [(count, item) for item, count in self.counts.items()]
+            heapq.heapify(self.heap)
+
+    def _pop_min(self):
+        while True:
+            count, item = heapq.heappop(self.heap)
+            if self.counts.get(item) == count:
+                return item, count
+
+    def update(self, item, count=1):
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            # Ganti item dengan hitungan terkecil; hitungannya menjadi batas error item baru
+            evicted, minimum = self._pop_min()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[item] = minimum + count
+            self.errors[item] = minimum
+        self._push(item)
+
+    def update_many(self, counter):
+        for item, count in counter.items():
+            self.update(item, count)
+
+    def top(self, k=10):
+        return sorted(self.counts.items(), key=lambda entry: (-entry[1], entry[0]))[:k]
+
+    def to_list(self):
+        return [[item, count, self.errors[item]] for item, count in self.counts.items()]
+
+    @classmethod
+    def from_list(cls, entries, capacity):
+        summary = cls(capacity)
+        for item, count, error in entries:
+            summary.counts[item] = count
+            summary.errors[item] = error
+        summary.heap = [(count, item) for item, count in summary.counts.items()]
+        heapq.heapify(summary.heap)
+        return summary
+
+
+class TrendTracker:
+    """Hour / day buckets of SpaceSaving summaries, persisted as compact JSON"""
+
+    def __init__(self, path="data/keyword_trends.json", capacity=500, hour_buckets=48, day_buckets=30,
+                 save_every=50):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self.limits = {"hour": hour_buckets, "day": day_buckets}
+        self.save_every = save_every
+        self.lock = threading.Lock()
+        self.buckets = {"hour": {}, "day": {}}
+        self.unsaved = 0
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            return
+        for granularity in self.buckets:
+            for key, entries in data.get(granularity, {}).items():
+                self.buckets[granularity][key] = SpaceSaving.from_list(entries, self.capacity)
+        self._expire()
+
+    def _expire(self):
+        for granularity, buckets in self.buckets.items():
+            for key in sorted(buckets)[:-self.limits[granularity]]:
+                del buckets[key]
+
+    def add(self, keywords, when=None):
+        """Feed one document's keyword Counter"""
+        if not keywords:
+            return
+        when = when or datetime.now()
+        keys = {"hour": when.strftime(HOUR_FORMAT), "day": when.strftime(DAY_FORMAT)}
+        with self.lock:
+            for granularity, key in keys.items():
+                buckets = self.buckets[granularity]
+                if key not in buckets:
+                    buckets[key] = SpaceSaving(self.capacity)
+                    self._expire()
+                buckets[key].update_many(keywords)
+            self.unsaved += 1
+            if self.unsaved >= self.save_every:
+                self._save()
+
+    def _save(self):
+        data = {granularity: {key: summary.to_list() for key, summary in buckets.items()}
+                for granularity, buckets in self.buckets.items()}
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self.unsaved = 0
+
+    def flush(self):
+        with self.lock:
+            self._save()
+
+    def top(self, window="24h", k=10, now=None):
+        """[(keyword, estimated_count, max_overcount)] over the last hour / 24h / day / 7d / 30d"""
+        granularity, span = WINDOWS[window]
+        now = now or datetime.now()
+        if granularity == "hour":
+            keys = {(now - timedelta(hours=i)).strftime(HOUR_FORMAT) for i in range(span)}
+        else:
+            keys = {(now - timedelta(days=i)).strftime(DAY_FORMAT) for i in range(span)}
+
+        # Merge SpaceSaving: bucket penuh yang tidak memuat item menyumbang hitungan minimumnya
+        # (item mungkin sudah tergusur dari situ) ke hitungan dan error item tersebut
+        counts, errors = {}, {}
+        floor_total = 0
+        with self.lock:
+            for key in keys & self.buckets[granularity].keys():
+                summary = self.buckets[granularity][key]
+                floor = min(summary.counts.values()) if len(summary.counts) >= summary.capacity else 0
+                floor_total += floor
+                for item, count in summary.counts.items():
+                    counts[item] = counts.get(item, 0) + count - floor
+                    errors[item] = errors.get(item, 0) + summary.errors[item] - floor
+        best = sorted(counts.items(), key=lambda entry: (-entry[1], entry[0]))[:k]
+        return [(item, count + floor_total, errors[item] + floor_total) for item, count in best]
+
+    def stats(self):
+        with self.lock:
+            return {granularity: len(buckets) for granularity, buckets in self.buckets.items()}
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+ZERO URL WATCH - Scheduled page monitoring with change detection
+Conditional GETs (ETag / Last-Modified) + a cheap body fingerprint, so the
+full analysis pipeline only runs when a page actually changed.
+"""
+
+import re
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+INTERVAL_PATTERN = re.compile(r"^(\d+)\s*([smhd]?)$", re.IGNORECASE)
+
+
+def parse_interval(text):
+    """'90', '30s', '5m', '2h', '1d' -> seconds"""
+    match = INTERVAL_PATTERN.match(str(text).strip())
+    if not match:
+        raise ValueError(f"Invalid interval: {text} (use e.g. 30s, 5m, 2h, 1d)")
+    seconds = int(match.group(1)) * INTERVAL_UNITS[(match.group(2) or "s").lower()]
+    if seconds <= 0:
+        raise ValueError(f"Invalid interval: {text} (must be greater than zero)")
+    return seconds
+
+
+def fingerprint(content):
+    """Cheap 128-bit body fingerprint"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.blake2b(content or b"", digest_size=16).hexdigest()
+
+
+class WatchList:
+    """Persistent set of watched URLs (data/url_watches.json)"""
+
+    def __init__(self, path="data/url_watches.json"):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.watches = self.load()
+
+    def load(self):
+        try:
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"❌ [URL Watch]: Watch list load error: {e}")
+        return {}
+
+    def save(self):
+        with self.lock:
+            snapshot = json.dumps(self.watches, indent=2)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot)
+        tmp_path.replace(self.path)
+
+    def add(self, url, interval):
+        with self.lock:
+            watch = self.watches.get(url, {
+                "url": url,
+                "etag": None,
+                "last_modified": None,
+                "fingerprint": None,
+                "last_checked": None,
+                "last_changed": None,
+                "next_due": 0,
+                "checks": 0,
+                "changes": 0,
+                "not_modified": 0,
+                "errors": 0
+            })
+            watch["interval"] = interval
+            watch["next_due"] = 0
+            self.watches[url] = watch
+        self.save()
+        return watch
+
+    def remove(self, url):
+        with self.lock:
+            removed = self.watches.pop(url, None)
+        if removed:
+            self.save()
+        return removed is not None
+
+    def due(self, now=None):
+        now = now or time.time()
+        with self.lock:
+            return [w for w in self.watches.values() if w["next_due"] <= now]
+
+
+class UrlWatcher:
+    """Checks due watches concurrently; calls on_change(watch, response) for changed pages"""
+
+    def __init__(self, web_client, watch_list, on_change, max_workers=8, timeout=15):
+        self.web_client = web_client
+        self.watch_list = watch_list
+        self.on_change = on_change
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def _check(self, watch):
+        """Conditional fetch of one URL; returns (status, response or error)"""
+        headers = {}
+        if watch.get("etag"):
+            headers["If-None-Match"] = watch["etag"]
+        if watch.get("last_modified"):
+            headers["If-Modified-Since"] = watch["last_modified"]
+
+        try:
+            response = self.web_client.get(watch["url"], headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                return "not_modified", None
+            response.raise_for_status()
+        except Exception as e:
+            return "error", str(e)
+
+        new_fingerprint = fingerprint(response.content)
+        status = "unchanged" if new_fingerprint == watch.get("fingerprint") else "changed"
+        return status, response
+
+    def run_due(self, now=None):
+        """Check every due watch with bounded concurrency; returns list of events"""
+        due = self.watch_list.due(now)
+        if not due:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(due))) as executor:
+            outcomes = list(executor.map(self._check, due))
+
+        events = []
+        checked_at = time.time()
+        for watch, (status, result) in zip(due, outcomes):
+            watch["checks"] += 1
+            watch["last_checked"] = datetime.now().isoformat()
+            watch["next_due"] = checked_at + watch["interval"]
+
+            if status == "error":
+                watch["errors"] += 1
+                events.append({"url": watch["url"], "status": status, "error": result})
+                continue
+            if status == "not_modified":
+                watch["not_modified"] += 1
+                events.append({"url": watch["url"], "status": status})
+                continue
+
+            response = result
+            watch["etag"] = response.headers.get("ETag")
+            watch["last_modified"] = response.headers.get("Last-Modified")
+            event = {"url": watch["url"], "status": status}
+
+            if status == "changed":
+                previous = watch.get("fingerprint")
+                watch["fingerprint"] = fingerprint(response.content)
+                watch["changes"] += 1
+                watch["last_changed"] = watch["last_checked"]
+                event.update({
+                    "previous_fingerprint": previous,
+                    "fingerprint": watch["fingerprint"],
+                    "first_check": previous is None
+                })
+                # Analisis berat hanya dijalankan di sini, sekali per perubahan
+                try:
+                    event["result"] = self.on_change(watch, response)
+                except Exception as e:
+                    event["error"] = f"Change handler error: {e}"
+            events.append(event)
+
+        self.watch_list.save()
+        return events
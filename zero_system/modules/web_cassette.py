@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+ZERO WEB CASSETTE - Record / replay transport for the Zero web client
+Record mode captures live responses to a cassette directory, replay mode
+serves them offline with optional simulated latency and bandwidth.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+MODES = ("live", "record", "replay")
+
+# Header yang ikut menentukan identitas request (selain method + url + body)
+KEY_HEADERS = ("Range", "If-None-Match", "If-Modified-Since")
+
+# Body disimpan sudah ter-decode, jadi header transport ini tidak valid lagi
+DROPPED_HEADERS = ("Content-Encoding", "Transfer-Encoding", "Content-Length")
+
+
+def cassette_key(request):
+    """Stable key for a PreparedRequest"""
+    digest = hashlib.sha1()
+    digest.update(f"{request.method} {request.url}".encode("utf-8"))
+    for name in KEY_HEADERS:
+        if name in request.headers:
+            digest.update(f"\n{name}: {request.headers[name]}".encode("utf-8"))
+    body = request.body
+    if body:
+        digest.update(b"\n\n")
+        digest.update(body if isinstance(body, bytes) else str(body).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Transport adapter that records to / replays from a cassette directory"""
+
+    def __init__(self, cassette_dir, mode="replay", latency=0.0, bandwidth=None, **kwargs):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        super().__init__(**kwargs)
+        self.cassette_dir = Path(cassette_dir)
+        self.mode = mode
+        self.latency = float(latency or 0.0)
+        self.bandwidth = float(bandwidth) if bandwidth else None  # bytes per second
+        self.lock = threading.Lock()
+        self.stats = {"recorded": 0, "replayed": 0, "missing": 0}
+        self.cassette_dir.mkdir(parents=True, exist_ok=True)
+
+    def send(self, request, **kwargs):
+        if self.mode == "record":
+            response = super().send(request, **kwargs)
+            self.save(request, response)
+            return response
+        return self.replay(request)
+
+    def paths_for(self, key):
+        return self.cassette_dir / f"{key}.json", self.cassette_dir / f"{key}.body"
+
+    def save(self, request, response):
+        """Persist a live response (body is fully read)"""
+        key = cassette_key(request)
+        meta_path, body_path = self.paths_for(key)
+        body = response.content
+        headers = {k: v for k, v in response.headers.items() if k not in DROPPED_HEADERS}
+        headers["Content-Length"] = str(len(body))
+
+        meta = {
+            "request": {"method": request.method, "url": request.url},
+            "url": response.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": headers,
+            "encoding": response.encoding,
+            "elapsed": response.elapsed.total_seconds(),
+            "recorded_at": datetime.now().isoformat()
+        }
+        with open(body_path, 'wb') as f:
+            f.write(body)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+        with self.lock:
+            self.stats["recorded"] += 1
+
+    def replay(self, request):
+        """Build a Response from the cassette, or fail like an unreachable host"""
+        key = cassette_key(request)
+        meta_path, body_path = self.paths_for(key)
+        if not meta_path.exists():
+            with self.lock:
+                self.stats["missing"] += 1
+            raise requests.exceptions.ConnectionError(
+                f"No cassette recorded for {request.method} {request.url}", request=request)
+
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        body = body_path.read_bytes() if body_path.exists() else b""
+
+        delay = self.latency
+        if self.bandwidth:
+            delay += len(body) / self.bandwidth
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = meta["status_code"]
+        response.reason = meta.get("reason")
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = meta.get("encoding")
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=delay)
+        response._content = body
+        response._content_consumed = True
+        response.raw = None
+
+        with self.lock:
+            self.stats["replayed"] += 1
+        return response
+
+
+def build_cassette_adapter(mode=None, cassette_dir=None, latency=None, bandwidth=None):
+    """Create an adapter from arguments or ZERO_WEB_* environment, None for live mode"""
+    mode = (mode or os.environ.get("ZERO_WEB_MODE") or "live").lower()
+    if mode not in MODES:
+        raise ValueError(f"ZERO_WEB_MODE must be one of {', '.join(MODES)}, got {mode}")
+    if mode == "live":
+        return None
+
+    cassette_dir = cassette_dir or os.environ.get("ZERO_CASSETTE_DIR", "data/web_cassettes")
+    if latency is None:
+        latency = float(os.environ.get("ZERO_REPLAY_LATENCY", "0") or 0)
+    if bandwidth is None:
+        bandwidth = float(os.environ.get("ZERO_REPLAY_BANDWIDTH", "0") or 0) or None
+    return CassetteAdapter(cassette_dir, mode=mode, latency=latency, bandwidth=bandwidth)
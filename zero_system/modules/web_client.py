@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+ZERO WEB CLIENT - Pooled HTTP client for all Zero web traffic
+Per-host token-bucket rate limiting + circuit breaker (closed / open / half-open)
+Optional record / replay transport (see web_cassette.py) for offline runs
+Per-phase timings for every request (see web_timing.py)
+"""
+
+import time
+import threading
+import urllib.parse
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from zero_system.modules.web_cassette import build_cassette_adapter
+from zero_system.modules.web_timing import (
+    install_phase_timing, start_timing, stop_timing, summarize_timings
+)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instantly when a host's circuit is open"""
+
+    def __init__(self, host, retry_in):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.1f}s")
+
+
+class TokenBucket:
+    """Token bucket: `rate` tokens per second, up to `capacity` burst"""
+
+    def __init__(self, rate=2.0, capacity=5):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def acquire(self):
+        """Take one token, sleeping until one is available. Returns seconds waited."""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            # Negative balance = reservation; caller sleeps until it is paid back
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def available(self):
+        with self.lock:
+            self._refill(time.monotonic())
+            return max(self.tokens, 0.0)
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker: closed -> open -> half_open -> closed"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.last_error = None
+        self.lock = threading.Lock()
+
+    def before_request(self):
+        """Return None if the request may proceed, otherwise seconds until retry"""
+        with self.lock:
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    return remaining
+                self.state = self.HALF_OPEN
+                self.probe_in_flight = False
+            if self.state == self.HALF_OPEN:
+                # Hanya satu probe yang boleh lewat saat half-open
+                if self.probe_in_flight:
+                    return self.recovery_timeout
+                self.probe_in_flight = True
+            return None
+
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.probe_in_flight = False
+
+    def release_probe(self):
+        """Request ended without a verdict on the host (e.g. malformed URL): let the next probe through"""
+        with self.lock:
+            self.probe_in_flight = False
+
+    def record_failure(self, category):
+        with self.lock:
+            self.failures += 1
+            self.last_error = category
+            self.probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def retry_in(self):
+        with self.lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(self.opened_at + self.recovery_timeout - time.monotonic(), 0.0)
+
+
+class WebClient:
+    """Pooled requests.Session with per-host rate limiter and circuit breaker"""
+
+    def __init__(self, user_agent=None, rate_per_host=2.0, burst_per_host=5,
+                 failure_threshold=5, recovery_timeout=30.0,
+                 mode=None, cassette_dir=None, replay_latency=None, replay_bandwidth=None,
+                 timing_samples=1000):
+        self.session = requests.Session()
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+
+        # Record / replay transport; mode defaults to ZERO_WEB_MODE (live|record|replay)
+        self.cassette = build_cassette_adapter(mode, cassette_dir, replay_latency, replay_bandwidth)
+        adapter = install_phase_timing(self.cassette or HTTPAdapter())
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.mode = self.cassette.mode if self.cassette else "live"
+
+        self.rate_per_host = rate_per_host
+        self.burst_per_host = burst_per_host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self.buckets = {}
+        self.breakers = {}
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "failures": 0, "rejected": 0, "throttled_seconds": 0.0}
+        self.timing_samples = deque(maxlen=timing_samples)
+
+    @staticmethod
+    def host_of(url):
+        return urllib.parse.urlsplit(url).netloc.lower()
+
+    def _host_state(self, host):
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate_per_host, self.burst_per_host)
+                self.breakers[host] = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+            return self.buckets[host], self.breakers[host]
+
+    @staticmethod
+    def failure_category(exc=None, response=None):
+        """Map an outcome to the error categories ZeroCore.web_request reports, None = healthy"""
+        if isinstance(exc, requests.exceptions.Timeout):
+            return "Timeout"
+        if isinstance(exc, requests.exceptions.ConnectionError):
+            return "ConnectionError"
+        if isinstance(exc, requests.exceptions.ChunkedEncodingError):
+            return "ChunkedEncodingError"  # body terputus di tengah pembacaan
+        if response is not None and (response.status_code >= 500 or response.status_code == 429):
+            return f"HTTPError {response.status_code}"
+        return None
+
+    def request(self, method, url, **kwargs):
+        """Send a request through the limiter and breaker for the URL's host"""
+        host = self.host_of(url)
+        bucket, breaker = self._host_state(host)
+
+        retry_in = breaker.before_request()
+        if retry_in is not None:
+            with self.lock:
+                self.stats["rejected"] += 1
+            raise CircuitOpenError(host, retry_in)
+
+        # Replay tidak menyentuh server asli, jadi tidak perlu di-throttle
+        waited = bucket.acquire() if self.mode != "replay" else 0.0
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["throttled_seconds"] += waited
+
+        # Body dibaca di sini (kecuali caller minta stream) supaya ttfb dan download terpisah
+        stream = kwargs.pop("stream", False)
+        timings = start_timing()
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, stream=True, **kwargs)
+            headers_at = time.perf_counter()
+            if not stream:
+                response.content
+        except requests.exceptions.RequestException as e:
+            category = self.failure_category(exc=e)
+            if category:
+                breaker.record_failure(category)
+                with self.lock:
+                    self.stats["failures"] += 1
+            else:
+                # InvalidURL, TooManyRedirects, ContentDecodingError, ...: tidak membuktikan host sehat
+                breaker.release_probe()
+            raise
+        except Exception:
+            # Mis. LocationParseError / UnicodeError dari URL rusak: bukan kesalahan host,
+            # tapi probe half-open harus dilepas agar host tidak terblokir selamanya
+            breaker.release_probe()
+            raise
+        finally:
+            stop_timing()
+
+        finished = time.perf_counter()
+        setup = timings["resolve"] + timings["connect"] + timings["tls"]
+        timings["ttfb"] = max(headers_at - started - setup, 0.0)
+        timings["download"] = finished - headers_at if not stream else None
+        timings["total"] = finished - started
+        response.zero_timings = timings
+        self.timing_samples.append((host, timings))
+
+        category = self.failure_category(response=response)
+        if category:
+            breaker.record_failure(category)
+            with self.lock:
+                self.stats["failures"] += 1
+        else:
+            breaker.record_success()
+        return response
+
+    @staticmethod
+    def add_timing(response, phase, seconds):
+        """Attach a caller-measured phase (parse, text_analysis) to a response's timings"""
+        timings = getattr(response, "zero_timings", None)
+        if timings is not None:
+            timings[phase] = timings.get(phase, 0.0) + seconds
+            timings["total"] = timings.get("total", 0.0) + seconds
+        return timings
+
+    def timing_stats(self, host=None):
+        """Per-host phase percentiles (ms) over recent requests"""
+        samples = [s for s in list(self.timing_samples) if host is None or s[0] == host]
+        return summarize_timings(samples)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def get_state(self):
+        """Snapshot of limiter and breaker state per host"""
+        with self.lock:
+            hosts = list(self.breakers.keys())
+            stats = dict(self.stats)
+
+        host_states = {}
+        for host in hosts:
+            bucket, breaker = self.buckets[host], self.breakers[host]
+            host_states[host] = {
+                "circuit": breaker.state,
+                "failures": breaker.failures,
+                "last_error": breaker.last_error,
+                "retry_in": round(breaker.retry_in(), 1),
+                "tokens": round(bucket.available(), 2)
+            }
+
+        stats["throttled_seconds"] = round(stats["throttled_seconds"], 2)
+        return {
+            "mode": self.mode,
+            "cassette": dict(self.cassette.stats) if self.cassette else None,
+            "rate_per_host": self.rate_per_host,
+            "burst_per_host": self.burst_per_host,
+            "hosts": host_states,
+            "open_circuits": [h for h, s in host_states.items() if s["circuit"] != CircuitBreaker.CLOSED],
+            "stats": stats
+        }
+
+    def close(self):
+        self.session.close()
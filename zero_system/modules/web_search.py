@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+ZERO WEB SEARCH - Structured search results pipeline
+Parses the DuckDuckGo HTML results page into (title, url, snippet) records,
+fetches and analyzes the top N results concurrently within a latency budget.
+"""
+
+import re
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from bs4 import BeautifulSoup
+
+DUCKDUCKGO_HTML_URL = "https://html.duckduckgo.com/html/"
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _unwrap_redirect(href):
+    """DuckDuckGo wraps result links in //duckduckgo.com/l/?uddg=<target>"""
+    if not href:
+        return None
+    if href.startswith("//"):
+        href = "https:" + href
+    parsed = urllib.parse.urlsplit(href)
+    if parsed.netloc.endswith("duckduckgo.com") and parsed.path.startswith("/l/"):
+        target = urllib.parse.parse_qs(parsed.query).get("uddg")
+        if target:
+            return target[0]
+    return href
+
+
+def parse_duckduckgo_results(html, limit=None):
+    """Parse a DuckDuckGo HTML results page into [{rank, title, url, snippet}]"""
+    soup = BeautifulSoup(html, "html.parser")
+    results = []
+    seen = set()
+
+    for block in soup.select("div.result"):
+        classes = block.get("class", [])
+        if "result--ad" in classes or "result--no-result" in classes:
+            continue
+
+        link = block.select_one("a.result__a")
+        if link is None:
+            continue
+        url = _unwrap_redirect(link.get("href"))
+        if not url or url in seen:
+            continue
+        seen.add(url)
+
+        snippet = block.select_one(".result__snippet")
+        results.append({
+            "rank": len(results) + 1,
+            "title": link.get_text(" ", strip=True),
+            "url": url,
+            "snippet": snippet.get_text(" ", strip=True) if snippet else ""
+        })
+        if limit and len(results) >= limit:
+            break
+
+    return results
+
+
+def query_terms(query):
+    return {w.lower() for w in WORD_PATTERN.findall(query) if len(w) > 1}
+
+
+def analyze_result_page(html, terms, text_analyzer=None):
+    """Lightweight page analysis used to re-rank search results"""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.find("title")
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    text = soup.get_text(" ")
+    words = [w.lower() for w in WORD_PATTERN.findall(text)]
+
+    term_hits = sum(1 for w in words if w in terms)
+    analysis = {
+        "page_title": title.text.strip() if title else "",
+        "description": meta_desc.get("content", "")[:200] if meta_desc else "",
+        "word_count": len(words),
+        "term_hits": term_hits,
+        "term_density": term_hits / len(words) if words else 0.0,
+        "links_count": len(soup.find_all("a", href=True))
+    }
+    if text_analyzer:
+        text_analysis = text_analyzer(text)
+        if text_analysis:
+            analysis["text_analysis"] = text_analysis
+    return analysis
+
+
+def relevance_score(result, terms):
+    """Blend search engine rank with query-term coverage of title/snippet/page"""
+    score = 1.0 / result["rank"]
+    haystack = f"{result['title']} {result['snippet']}".lower()
+    if terms:
+        score += sum(1 for t in terms if t in haystack) / len(terms)
+    page = result.get("analysis")
+    if page:
+        score += min(page["term_density"] * 20, 1.0)
+    return round(score, 4)
+
+
+class SearchPipeline:
+    """Search -> parse -> concurrent top-N fetch -> analyze -> rank"""
+
+    def __init__(self, web_client, search_url=DUCKDUCKGO_HTML_URL, max_workers=5, text_analyzer=None):
+        self.web_client = web_client
+        self.search_url = search_url
+        self.max_workers = max_workers
+        self.text_analyzer = text_analyzer
+
+    def fetch_results_page(self, query, timeout):
+        response = self.web_client.get(self.search_url, params={"q": query}, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
+    def _fetch_and_analyze(self, result, terms, timeout):
+        started = time.perf_counter()
+        response = self.web_client.get(result["url"], timeout=timeout)
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "").lower()
+        analysis = {"status_code": response.status_code, "content_type": content_type}
+        if "html" in content_type:
+            analysis.update(analyze_result_page(response.text, terms, self.text_analyzer))
+        analysis["fetch_time"] = round(time.perf_counter() - started, 3)
+        return analysis
+
+    def search(self, query, top_n=5, budget=10.0):
+        """Run the full pipeline; returns a summary dict ranked by relevance"""
+        started = time.perf_counter()
+        deadline = started + budget
+        terms = query_terms(query)
+
+        html = self.fetch_results_page(query, timeout=budget)
+        results = parse_duckduckgo_results(html)
+        top = results[:top_n]
+
+        remaining = deadline - time.perf_counter()
+        if top and remaining > 0:
+            executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(top)))
+            futures = {executor.submit(self._fetch_and_analyze, r, terms, remaining): r for r in top}
+            pending = set(futures)
+            while pending:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = futures[future]
+                    try:
+                        result["analysis"] = future.result()
+                    except Exception as e:
+                        result["error"] = str(e)
+            for future in pending:
+                futures[future]["error"] = f"Latency budget of {budget}s exceeded"
+            # Jangan tunggu fetch yang masih berjalan; budget sudah habis
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            for result in top:
+                result["error"] = f"Latency budget of {budget}s exceeded"
+
+        for result in top:
+            result["score"] = relevance_score(result, terms)
+        ranked = sorted(top, key=lambda r: r["score"], reverse=True)
+
+        return {
+            "query": query,
+            "total_results": len(results),
+            "fetched": len([r for r in top if "analysis" in r]),
+            "failed": len([r for r in top if "error" in r]),
+            "elapsed": round(time.perf_counter() - started, 3),
+            "budget": budget,
+            "results": ranked,
+            "other_results": results[top_n:]
+        }
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+ZERO WEB TIMING - Per-phase request timing
+resolve / connect / tls are captured inside urllib3 connections, ttfb and
+download by the web client, parse / text_analysis by the analyzers.
+"""
+
+import math
+import time
+import socket
+import threading
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+PHASES = ("resolve", "connect", "tls", "ttfb", "download", "parse", "text_analysis", "total")
+
+_local = threading.local()
+
+
+def start_timing():
+    """Begin collecting phases for the request running on this thread"""
+    timings = {"resolve": 0.0, "connect": 0.0, "tls": 0.0, "new_connections": 0}
+    _local.timings = timings
+    return timings
+
+
+def stop_timing():
+    _local.timings = None
+
+
+def _current():
+    return getattr(_local, "timings", None)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """Records DNS resolve and TCP connect time of new connections"""
+
+    def _new_conn(self):
+        timings = _current()
+        if timings is None:
+            return super()._new_conn()
+
+        started = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            # Biarkan urllib3 yang membungkus error resolusi seperti biasa
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        timings["resolve"] += resolved - started
+
+        # Connect ke alamat yang sudah di-resolve (tanpa DNS kedua), dengan fallback antar alamat
+        host = self._dns_host
+        error = None
+        try:
+            for info in infos:
+                self._dns_host = info[4][0]
+                try:
+                    sock = super()._new_conn()
+                    break
+                except Exception as e:
+                    error = e
+            else:
+                raise error
+        finally:
+            self._dns_host = host
+
+        timings["connect"] += time.perf_counter() - resolved
+        timings["new_connections"] += 1
+        return sock
+
+
+class TimedHTTPSConnection(HTTPSConnection, TimedHTTPConnection):
+    """Adds TLS handshake time on top of resolve / connect"""
+
+    def connect(self):
+        timings = _current()
+        if timings is None:
+            return super().connect()
+
+        before = timings["resolve"] + timings["connect"]
+        started = time.perf_counter()
+        super().connect()
+        elapsed = time.perf_counter() - started
+        timings["tls"] += max(elapsed - (timings["resolve"] + timings["connect"] - before), 0.0)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def install_phase_timing(adapter):
+    """Make an HTTPAdapter (or subclass) open timed connections"""
+    adapter.poolmanager.pool_classes_by_scheme = {
+        "http": TimedHTTPConnectionPool,
+        "https": TimedHTTPSConnectionPool
+    }
+    return adapter
+
+
+def rounded_timings(timings):
+    """Copy of a timings dict suitable for JSON storage (seconds, µs precision)"""
+    return {k: round(v, 6) if isinstance(v, float) else v for k, v in (timings or {}).items()}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize_timings(samples):
+    """[(host, timings), ...] -> {host: {phase: {count, mean, p50, p90, p99, max}}} in ms"""
+    by_host = {}
+    for host, timings in samples:
+        phases = by_host.setdefault(host, {})
+        for phase in PHASES:
+            value = timings.get(phase)
+            if value is not None:
+                phases.setdefault(phase, []).append(value)
+
+    summary = {}
+    for host, phases in by_host.items():
+        summary[host] = {}
+        for phase, values in phases.items():
+            values.sort()
+            summary[host][phase] = {
+                "count": len(values),
+                "mean": round(sum(values) / len(values) * 1000, 2),
+                "p50": round(percentile(values, 50) * 1000, 2),
+                "p90": round(percentile(values, 90) * 1000, 2),
+                "p99": round(percentile(values, 99) * 1000, 2),
+                "max": round(values[-1] * 1000, 2)
+            }
+    return summary
+
+
+def format_timing_summary(summary, phases=("resolve", "connect", "tls", "ttfb", "download", "parse", "text_analysis")):
+    """Text table used by the 'web stats' commands"""
+    if not summary:
+        return "No timing samples recorded yet"
+    lines = []
+    for host, host_phases in sorted(summary.items()):
+        count = max((p["count"] for p in host_phases.values()), default=0)
+        lines.append(f"🌐 {host} ({count} requests)")
+        for phase in phases:
+            if phase in host_phases:
+                p = host_phases[phase]
+                lines.append(f"   • {phase:<13} p50 {p['p50']:>8.1f}ms  p90 {p['p90']:>8.1f}ms  "
+                             f"p99 {p['p99']:>8.1f}ms  max {p['max']:>8.1f}ms")
+    return "\n".join(lines)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+ZERO WEBHOOK RECEIVER - Local inbound webhook endpoint (stdlib http.server)
+POST /hooks/<dataset> with a JSON body is acknowledged (202) as soon as the
+payload is queued; a single flusher thread drains the bounded queue in
+batches. When the queue is full the request gets 503 + Retry-After instead
+of blocking the server (backpressure). Payloads whose flush fails are retried
+and, after MAX_FLUSH_ATTEMPTS, kept as dead letters instead of being dropped.
+"""
+
+import hmac
+import json
+import queue
+import socket
+import threading
+import time
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from zero_system.modules.data_sink import valid_dataset_name
+
+QUEUE_SIZE = 10000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.5
+BATCH_LINGER = 0.05
+MAX_BODY_BYTES = 1024 * 1024
+DEFAULT_DATASET = "webhooks"
+RETRY_DELAY = 1.0
+MAX_FLUSH_ATTEMPTS = 5
+STOP_GRACE = 5.0  # detik menunggu handler yang masih berjalan saat stop
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: satu koneksi untuk banyak request
+    server_version = "ZeroWebhook/1.0"
+    # Header + body dalam satu write, di-flush sekali per request: tanpa jeda delayed-ACK ~40 ms
+    wbufsize = 64 * 1024
+
+    def log_message(self, format, *args):
+        pass  # jangan cetak satu baris per request
+
+    def setup(self):
+        super().setup()
+        self.server.receiver._track(self.connection, True)
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            self.server.receiver._track(self.connection, False)
+
+    def _reply(self, status, body, headers=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("", "/health"):
+            self._reply(200, self.server.receiver.stats())
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def _reply_stopping(self):
+        self.close_connection = True
+        self._reply(503, {"error": "receiver stopping"}, {"Retry-After": "1", "Connection": "close"})
+
+    def do_POST(self):
+        receiver = self.server.receiver
+        if receiver.stopping:
+            self._reply_stopping()
+            return
+        parts = [p for p in self.path.split("?", 1)[0].split("/") if p]
+        if not parts or parts[0] != "hooks" or len(parts) > 2:
+            self._reply(404, {"error": "POST to /hooks or /hooks/<dataset>"})
+            return
+        dataset = parts[1] if len(parts) == 2 else DEFAULT_DATASET
+        if not valid_dataset_name(dataset):
+            self.close_connection = True
+            self._reply(404, {"error": "dataset names use letters, digits, '_' or '-' (max 31)"})
+            return
+
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            self.close_connection = True
+            self._reply(411, {"error": "Content-Length required"})
+            return
+        length = int(length)
+        if length > receiver.max_body:
+            self.close_connection = True
+            self._reply(413, {"error": f"body larger than {receiver.max_body} bytes"})
+            return
+        body = self.rfile.read(length)
+
+        # Perbandingan waktu-konstan: token tidak bisa ditebak dari lama respons.
+        # http.server men-decode header sebagai latin-1, jadi encode balik ke byte aslinya.
+        supplied = self.headers.get("X-Webhook-Token", "").encode("latin-1", errors="replace")
+        if receiver.token and not hmac.compare_digest(supplied, receiver.token.encode("utf-8")):
+            receiver._count("unauthorized")
+            self._reply(401, {"error": "invalid token"})
+            return
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            receiver._count("invalid")
+            self._reply(400, {"error": "invalid JSON"})
+            return
+
+        if receiver.submit(dataset, payload):
+            self._reply(202, {"accepted": True})
+        elif receiver.stopping:
+            self._reply_stopping()
+        else:
+            self._reply(503, {"error": "queue full"}, {"Retry-After": "1"})
+
+
+class WebhookReceiver:
+    """Threaded HTTP receiver + bounded queue + batch flusher calling on_batch(items)
+
+    Each item is {"dataset", "received_at", "payload"}; on_batch runs on the
+    flusher thread only, so it never needs to be thread-safe itself. It may
+    return the items it could not store (raising fails the whole batch); those
+    are retried, then kept in `dead_letters` / appended to `dead_letter_path`.
+    """
+
+    def __init__(self, on_batch, host="127.0.0.1", port=8765, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE,
+                 flush_interval=FLUSH_INTERVAL, linger=BATCH_LINGER, token=None, max_body=MAX_BODY_BYTES,
+                 dead_letter_path=None):
+        self.on_batch = on_batch
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.linger = linger
+        self.token = token
+        self.max_body = max_body
+        self.dead_letter_path = dead_letter_path
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.lock = threading.Lock()
+        self.counters = {"accepted": 0, "rejected_full": 0, "rejected_stopping": 0, "invalid": 0,
+                         "unauthorized": 0, "flushed": 0, "batches": 0, "flush_errors": 0, "retried": 0,
+                         "dead_letters": 0}
+        self.server = None
+        self.stopping = False
+        self.dead_letters = []
+        self._retry = []
+        self._retry_at = 0.0
+        self._connections = set()
+        self._idle = threading.Condition(self.lock)
+        self._stop = threading.Event()
+        self._threads = []
+
+    def _count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] += amount
+
+    def _track(self, connection, alive):
+        with self.lock:
+            if alive:
+                self._connections.add(connection)
+            else:
+                self._connections.discard(connection)
+                self._idle.notify_all()
+
+    def submit(self, dataset, payload):
+        """Queue one payload without blocking; False when the queue is full or the receiver is stopping"""
+        item = {"dataset": dataset, "received_at": datetime.now().isoformat(), "payload": payload}
+        # Di bawah lock yang sama dengan stop(): setelah stopping diset tidak ada payload baru yang masuk antrean
+        with self.lock:
+            if self.stopping:
+                self.counters["rejected_stopping"] += 1
+                return False
+            try:
+                self.queue.put_nowait(item)
+            except queue.Full:
+                self.counters["rejected_full"] += 1
+                return False
+            self.counters["accepted"] += 1
+        return True
+
+    def start(self):
+        self.server = ThreadingHTTPServer((self.host, self.port), _WebhookHandler)
+        self.server.daemon_threads = True
+        self.server.receiver = self
+        self.port = self.server.server_address[1]  # port=0 -> port acak dari OS
+        self.stopping = False
+        self._stop.clear()
+        self._threads = [threading.Thread(target=self.server.serve_forever, name="webhook-http", daemon=True),
+                         threading.Thread(target=self._flush_loop, name="webhook-flush", daemon=True)]
+        for thread in self._threads:
+            thread.start()
+        return self.port
+
+    def _next_batch(self):
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        # Tunggu sebentar (linger) agar batch terisi: lebih sedikit append/fsync dan entri memori
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch, final=False):
+        try:
+            failed = list(self.on_batch(batch) or [])
+        except Exception as e:
+            failed = batch
+            print(f"❌ [Webhook]: Batch of {len(batch)} payloads failed: {e}")
+        self._count("flushed", len(batch) - len(failed))
+        self._count("batches")
+        if not failed:
+            return
+        self._count("flush_errors")
+        exhausted = []
+        for item in failed:
+            item["attempts"] = item.get("attempts", 0) + 1
+            if final or item["attempts"] >= MAX_FLUSH_ATTEMPTS:
+                exhausted.append(item)
+            else:
+                self._retry.append(item)
+        if len(exhausted) < len(failed):
+            self._count("retried", len(failed) - len(exhausted))
+            self._retry_at = time.monotonic() + RETRY_DELAY
+        if exhausted:
+            self._dead_letter(exhausted)
+
+    def _dead_letter(self, items):
+        """Keep payloads that could not be stored (memory + optional JSONL file)"""
+        self.dead_letters.extend(items)
+        self._count("dead_letters", len(items))
+        print(f"⚠️ [Webhook]: {len(items)} payloads kept as dead letters")
+        if self.dead_letter_path:
+            try:
+                with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+                    f.write("".join(json.dumps(item, ensure_ascii=False, default=str) + "\n" for item in items))
+            except Exception as e:
+                print(f"❌ [Webhook]: Dead letter write failed: {e}")
+
+    def _flush_retries(self, final=False):
+        if self._retry and (final or time.monotonic() >= self._retry_at):
+            batch, self._retry = self._retry, []
+            self._flush(batch, final=final)
+
+    def _flush_loop(self):
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+            self._flush_retries()
+        # Kuras sisa antrean saat berhenti; yang masih gagal dicoba sekali lagi lalu jadi dead letter
+        while True:
+            batch = self._next_batch() if not self.queue.empty() else []
+            if not batch:
+                break
+            self._flush(batch)
+        self._flush_retries(final=True)
+
+    def stop(self):
+        """Refuse new payloads, close keep-alive connections, then drain the queue"""
+        if self.server is None:
+            return
+        with self.lock:
+            self.stopping = True
+        self.server.shutdown()  # hanya menghentikan accept; koneksi keep-alive masih hidup
+        with self.lock:
+            # SHUT_RD: handler yang menunggu request berikutnya langsung dapat EOF,
+            # balasan yang sedang ditulis tetap terkirim
+            for connection in list(self._connections):
+                try:
+                    connection.shutdown(socket.SHUT_RD)
+                except OSError:
+                    pass
+            self._idle.wait_for(lambda: not self._connections, timeout=STOP_GRACE)
+        self.server.server_close()
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=30)
+        self.server = None
+
+    @property
+    def running(self):
+        return self.server is not None
+
+    def stats(self):
+        with self.lock:
+            return {**self.counters, "queued": self.queue.qsize(), "retry_pending": len(self._retry),
+                    "running": self.running, "address": f"http://{self.host}:{self.port}"}